@@ -43,6 +43,7 @@
  *                   Code clean-up.
  *  1.3   Feb-2023   Supported qureg state expectation calculation and fixed
  *                   terminology for state probability measure.
+ *  1.4   Oct-2026   Supported batched qureg state transformations.
  *
  *  --------------------------------------------------------------------------
  */
@@ -83,6 +84,48 @@ void qSim_qasm_message::add_param_tagValue(std::string par_tag, std::string par_
 	m_params.insert(std::make_pair(par_tag, par_val));
 }
 
+// ------------------------------------------------------
+// batched operations decoding
+
+// coding format: ASCII string with ";" as operation separators
+//   <ops> = <op_1>;<op_2>; ... <op_n>
+//
+// with "&" as param tag + value pairs separator
+//   <op> = <par_tag_1>=<par_value_1>&<par_tag_2>=<par_value_2>& ... <par_tag_n>=<par_value_n>
+
+bool qSim_qasm_message::get_param_ops(QASM_MSG_OPS_TYPE* ops) {
+	// extract the operations params from the batched operations parameter
+	ops->clear();
+	if (m_params.count(QASM_MSG_PARAM_TAG_F_OPS) == 0)
+		return false;
+	std::string bufStr = m_params[QASM_MSG_PARAM_TAG_F_OPS];
+
+	while (bufStr.size() > 0) {
+		// get operation string
+		int idx = bufStr.find(QASM_MSG_OPS_SEP);
+		std::string op_str = (idx < 0) ? bufStr : bufStr.substr(0, idx);
+		bufStr = (idx < 0) ? "" : bufStr.substr(idx+1);
+
+		// get operation params
+		QASM_MSG_PARAMS_TYPE op_params;
+		while (op_str.size() > 0) {
+			int idx1 = op_str.find(QASM_MSG_OPS_PARAM_SEP);
+			std::string par_pair = (idx1 < 0) ? op_str : op_str.substr(0, idx1);
+			op_str = (idx1 < 0) ? "" : op_str.substr(idx1+1);
+
+			int idx2 = par_pair.find(QASM_MSG_PARVAL_SEP);
+			if (idx2 < 1) {
+				cerr << "qSim_qasm_message::get_param_ops - wrong parameter tag-value format!" << endl;
+				return false;
+			}
+			op_params.insert(std::make_pair(par_pair.substr(0, idx2), par_pair.substr(idx2+1)));
+		}
+		if (op_params.size() > 0)
+			ops->push_back(op_params);
+	}
+	return (ops->size() > 0);
+}
+
 // ------------------------------------------------------
 // content syntax checking
 bool qSim_qasm_message::check_syntax() {
@@ -236,6 +279,22 @@ bool qSim_qasm_message::check_syntax() {
 		}
 		break;
 
+		case QASM_MSG_ID_QREG_ST_TRANSFORM_BATCH: {
+			// params:
+			// (1) qr_h = <value>
+			// (2) f_ops = <value> (transformation params for each operation, see get_param_ops)
+			//
+			if (m_params.count(QASM_MSG_PARAM_TAG_QREG_H) == 0) {
+				log_missing_param_tag(QASM_MSG_PARAM_TAG_QREG_H);
+				res = false;
+			}
+			else if (m_params.count(QASM_MSG_PARAM_TAG_F_OPS) == 0) {
+				log_missing_param_tag(QASM_MSG_PARAM_TAG_F_OPS);
+				res = false;
+			}
+		}
+		break;
+
 		// --------------------
 
 		case QASM_MSG_ID_QREG_ST_PEEK: {
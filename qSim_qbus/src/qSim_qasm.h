@@ -46,6 +46,9 @@
  *  1.3   Feb-2023   Supported qureg state expectation calculation and fixed
  *                   terminology for state probability measure.
  *                   Handled QML function blocks (feature map and q-net).
+ *  1.4   Oct-2026   Supported batched qureg state transformations.
+ *                   Supported binary (base64) qureg state values, measured state
+ *                   indexes and client capabilities negotiation.
  *
  *  --------------------------------------------------------------------------
  */
@@ -55,6 +58,7 @@
 
 #include <map>
 #include <string>
+#include <vector>
 
 
 ///////////////////////////////////////////////////////////////////////////
@@ -75,6 +79,7 @@
 #define QASM_MSG_ID_QREG_ST_PEEK      15
 #define QASM_MSG_ID_QREG_ST_MEASURE   16
 #define QASM_MSG_ID_QREG_ST_EXPECT    17
+#define QASM_MSG_ID_QREG_ST_TRANSFORM_BATCH 18
 
 // message responses
 #define QASM_MSG_ID_RESPONSE 20
@@ -84,14 +89,20 @@
 #define QASM_MSG_PARAM_SEP ":"
 #define QASM_MSG_PARVAL_SEP "="
 
+// batched operations separators (transformation batch only)
+#define QASM_MSG_OPS_SEP        ";"
+#define QASM_MSG_OPS_PARAM_SEP  "&"
+
 // message parameter tags
 #define QASM_MSG_PARAM_TAG_CLIENT_ID    "id"		// client mnemonic identifier
 #define QASM_MSG_PARAM_TAG_CLIENT_TOKEN "token"		// client unique token
+#define QASM_MSG_PARAM_TAG_CLIENT_CAPS  "caps"		// client/server supported capabilities
 
 #define QASM_MSG_PARAM_TAG_QREG_QN      "qr_n"       // qureg size in qubits
 #define QASM_MSG_PARAM_TAG_QREG_H       "qr_h" 		 // qureg state handler
 #define QASM_MSG_PARAM_TAG_QREG_STIDX   "qr_stIdx" 	 // qureg state index (pure state set)
 #define QASM_MSG_PARAM_TAG_QREG_STVALS  "qr_stVals"  // qureg state values (arbitrary state set)
+#define QASM_MSG_PARAM_TAG_QREG_STVALS_BIN "qr_stValsBin" // qureg state values as base64 encoded complex128 array
 #define QASM_MSG_PARAM_TAG_QREG_MQIDX   "qr_mQidx" 	 // qureg measurement start qubit
 #define QASM_MSG_PARAM_TAG_QREG_MQLEN   "qr_mQlen" 	 // qureg measurement length
 #define QASM_MSG_PARAM_TAG_QREG_MRAND   "qr_mRand" 	 // qureg measurement random flag
@@ -99,6 +110,7 @@
 #define QASM_MSG_PARAM_TAG_QREG_MSTIDX  "qr_mStIdx"	 // qureg measurement state index
 #define QASM_MSG_PARAM_TAG_QREG_MSTPR   "qr_mStPr"	 // qureg measurement state probability
 #define QASM_MSG_PARAM_TAG_QREG_MSTIDXS "qr_mStIdxs" // qureg measurement state index vector
+#define QASM_MSG_PARAM_TAG_QREG_MSTIDXS_BIN "qr_mStIdxsBin" // qureg measurement state index vector as base64 encoded uint32 array
 #define QASM_MSG_PARAM_TAG_QREG_EXSTIDX "qr_exStIdx" // qureg measurement state index
 #define QASM_MSG_PARAM_TAG_QREG_EXQIDX  "qr_exQidx"  // qureg state expectation start qubit
 #define QASM_MSG_PARAM_TAG_QREG_EXQLEN  "qr_exQlen"  // qureg state expectation length
@@ -113,6 +125,7 @@
 #define QASM_MSG_PARAM_TAG_F_TRANGE   "f_tRange"	// function target qubit index range (controlled-U only)
 #define QASM_MSG_PARAM_TAG_F_UTYPE    "f_uType"		// function-U type
 #define QASM_MSG_PARAM_TAG_F_ARGS     "f_args"		// function arguments, including function-U args if any
+#define QASM_MSG_PARAM_TAG_F_OPS      "f_ops"		// batched function operations (transformation batch only)
 
 #define QASM_MSG_PARAM_TAG_FBQML_REP      "fqml_rep"         // QML block repetitions
 #define QASM_MSG_PARAM_TAG_FBQML_ENTANG   "fqml_entang_type" // QML entanglement type
@@ -126,6 +139,9 @@
 #define QASM_MSG_PARAM_VAL_OK  "Ok"
 #define QASM_MSG_PARAM_VAL_NOK "Not-Ok"
 
+// capabilities (comma separated list in caps param)
+#define QASM_MSG_PARAM_VAL_CAPS_STBIN "stBin" // binary qureg state values
+
 
 // -----------------------------------------------
 
@@ -135,6 +151,7 @@ typedef std::string QASM_MSG_ACCESS_TOKEN_TYPE;
 typedef int QASM_MSG_ID_TYPE;
 typedef unsigned int QASM_MSG_COUNTER_TYPE;
 typedef std::map<std::string, std::string> QASM_MSG_PARAMS_TYPE;
+typedef std::vector<QASM_MSG_PARAMS_TYPE> QASM_MSG_OPS_TYPE;
 
 // -----------------------------------------------
 
@@ -154,13 +171,17 @@ public:
 	QASM_MSG_PARAMS_TYPE  get_params()	{ return m_params; }
 
 	bool is_control_message()     { return ((m_id==QASM_MSG_ID_REGISTER) || (m_id==QASM_MSG_ID_UNREGISTER)); }
-	bool is_instruction_message() { return ((m_id>=QASM_MSG_ID_QREG_ALLOCATE) && (m_id<=QASM_MSG_ID_QREG_ST_EXPECT)); }
+	bool is_instruction_message() { return ((m_id>=QASM_MSG_ID_QREG_ALLOCATE) && (m_id<=QASM_MSG_ID_QREG_ST_TRANSFORM_BATCH)); }
+	bool is_batch_message()       { return (m_id==QASM_MSG_ID_QREG_ST_TRANSFORM_BATCH); }
 
 	// message parameters handling
 	bool check_param_valueByTag(std::string par_tag)      { return (m_params.count(par_tag) > 0); };
 	std::string get_param_valueByTag(std::string par_tag) { return m_params[par_tag]; };
 	void add_param_tagValue(std::string par_tag, std::string par_val);
 
+	// batched operations decoding (transformation batch only)
+	bool get_param_ops(QASM_MSG_OPS_TYPE* ops);
+
 	// content syntax checking
 	bool check_syntax();
 
@@ -34,6 +34,8 @@
  *                   loop).
  *  1.3   Mar-2023   Improved server and client socket transfer performance setting
  *                   TCP NODELAY flag (5x improvement).
+ *  1.4   Oct-2026   Socket write not raising SIGPIPE on peer closed connection.
+ *                   TCP NODELAY flag set on accepted client socket too.
  *
  *  --------------------------------------------------------------------------
  */
@@ -63,6 +65,11 @@ using namespace std;
 #define QSOCK_SELECT_TIMEOUT_SEC 0
 #define QSOCK_SELECT_TIMEOUT_USEC 10000
 
+#ifndef MSG_NOSIGNAL
+// not available (e.g. windows - no SIGPIPE there)
+#define MSG_NOSIGNAL 0
+#endif
+
 
 ///////////////////////////////////////////////////////////////////
 ////  ABSTRACT BASE CLASS
@@ -176,7 +183,8 @@ int qSim_qsocket_base::read_raw_data(int sockFd, unsigned char* buf, int len) {
 
 int qSim_qsocket_base::write_raw_data(int sockFd, unsigned char* buf, int len) {
     // write buffered data of given len to given socket
-    int ret = send(sockFd, (char*)buf, len, 0);
+    // (no SIGPIPE raised if peer already closed, e.g. fire-and-forget disconnect)
+    int ret = send(sockFd, (char*)buf, len, MSG_NOSIGNAL);
     if (ret < 0) {
     	// error writing data to socket
     	cerr << "qSim_socket - error writing data to socket - errno: " << errno << endl;
@@ -270,11 +278,21 @@ int qSim_qsocket_server::accept_client() {
     struct sockaddr_in client_addr;
     socklen_t client_addrSize = sizeof(client_addr);
     m_cln_sockfd = accept(m_sockfd, (struct sockaddr*)&client_addr, &client_addrSize);
+
+    // no-delay set on client socket too (inheritance from listening socket not granted)
+    int yes = 1;
+    if (setsockopt(m_cln_sockfd, IPPROTO_TCP, TCP_NODELAY, &yes, sizeof(int)) == -1)
+        cerr << "qSim_qsocket_server setsockopt error for client TCP_NODELAY - errno: " << errno << endl;
 #else
     // windows case
     SOCKADDR_IN client_addr;
     int client_addrSize = sizeof(client_addr);
     m_cln_sockfd = accept(m_sockfd, (SOCKADDR *)&client_addr, &client_addrSize);
+
+    // no-delay set on client socket too (inheritance from listening socket not granted)
+    bool yes = true;
+    if (setsockopt(m_cln_sockfd, IPPROTO_TCP, TCP_NODELAY, (char*)&yes, sizeof(DWORD)) == SOCKET_ERROR)
+        cerr << "qSim_qsocket_server setsockopt error for client TCP_NODELAY - errno: " << errno << endl;
 #endif
 
     if (m_verbose)
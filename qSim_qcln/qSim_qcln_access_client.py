@@ -41,12 +41,55 @@ Created on Sat May 28 21:58:57 2022
 *                 Supported qureg state expectations calculation.
 *                 Handled QML function blocks (feature map and q-net).
 *                 Supported diagnostic flag for getting message size info.
+* 1.3   Oct-2026  Requests encoded straight from tag/value pairs and shared
+*                 request/response exchange methods.
+*                 Supported batched qureg state transformations.
+*                 Vectorized qureg state values string parsing and formatting.
+*                 Supported binary qureg state values and measured state
+*                 indexes, negotiated at connect.
+*                 Supported asyncio based pipelined state transformations.
+*                 Requests sent as encoded bytes, with no intermediate buffer copy.
+*                 Measured state index vector parsed as literal (no eval).
+*                 Supported queued requests sent in one go (flush) and
+*                 coalesced async requests sending.
+*                 Token param encoded once at registration and used as prefix
+*                 for all requests.
+*                 Function arguments formatters selected once per function type.
+*                 Small integer param values taken from a strings table.
+*                 Return code only responses checked on the raw message.
+*                 Single verbose check in state transformation hot path.
+*                 Function argument helpers returning tokens without separator.
+*                 Response message instance reused for sync requests.
+*                 Faster qureg state values string parsing and formatting.
+*                 Disconnection optionally not waiting for server acknowledge.
+*                 Qureg state values string parsed in a single numpy pass, with no 
+*                 per-call warnings handling.
+*                 Simplified index range string formatting.
+*                 Encoded transformation request params cached for repeated calls.
+*                 Added pipelined state transformations (one request each, 
+*                 single round trip).
+*                 Added windowed state transformations (bounded requests in flight).
+*                 Pending async requests failed on unmatched response counter.
+*                 Queued batch transformations sent before any other request,
+*                 batch context supported.
+*                 Pipelined and windowed transformation responses checked against 
+*                 request counters.
+*                 Pending async requests failed on responses reader cancellation,
+*                 requests queued while async requests in flight sent right away.
+*                 Pipelined transformation requests sent in blocks bounded by the 
+*                 socket buffer size.
 * 
 * ------------------------------------------------------------------------
 *
 """
 
 
+import ast
+import warnings
+import contextlib
+import base64
+import asyncio
+
 import numpy as np
 
 import qSim_qcln_socket as qsock
@@ -59,6 +102,51 @@ import qSim_qcln_qasm as qasm
 # QSIM_SERVER_IP_ADDR = '127.0.0.1'
 # QSIM_SERVER_PORT    = 27020
 
+# room reserved for batched transformation message header (token, qureg handler, etc.)
+QSIM_BATCH_MSG_HDR_LEN = 256
+
+# qureg state value format - as (real, imag) pair
+QSIM_ST_VAL_FORMAT = '(%.9g, %.9g) '
+QSIM_ST_VAL_DELIMITERS = str.maketrans(',', ' ', '()') # parenthesis removal, commas to blanks
+
+# qureg state values partial parse (e.g. non-numeric tokens) raised as an error, not truncated 
+# - set once for this module, see states_string_2_complex
+warnings.filterwarnings('error', message='string or file could not be read to its end', 
+                        category=DeprecationWarning, module=__name__)
+
+# function arguments formatters, by (function type, function-U type) - see fargs_to_string
+QSIM_FARGS_FORMATTERS = {}
+
+# empty index range string
+QSIM_EMPTY_RANGE = '(-1, -1)'
+
+# max encoded transformation requests cached per client - see qreg_state_transform
+QSIM_TRF_CACHE_LEN = 256
+
+# max pipelined transformation requests in flight - their responses (each well within 
+# QSIM_PIPE_RESP_MAX_LEN) must fit the client receive buffer, or the server would block 
+# sending them while the client is still sending requests - see qreg_state_transform_pipelined
+QSIM_PIPE_RESP_MAX_LEN = 256
+QSIM_PIPE_MAX_OPS = qsock.QSIM_SOCK_BUF_SIZE // QSIM_PIPE_RESP_MAX_LEN
+
+# return code ok param as in raw response messages, preceded by field or param separator
+# - see receive_response_result
+QSIM_RESULT_OK_PARAM = qasm.qSim_qcln_qasm.encode_param(qasm.QASM_MSG_PARAM_TAG_RESULT, qasm.QASM_MSG_PARAM_VAL_OK)
+QSIM_RESULT_OK_PARAM_PREV = (qasm.QASM_MSG_FIELD_SEP, qasm.QASM_MSG_PARAM_SEP)
+
+# small non-negative integers as strings - see int_2_string
+QSIM_INT_STR_LEN = 1024
+QSIM_INT_STR = tuple([str(i) for i in range(QSIM_INT_STR_LEN)])
+
+def int_2_string(val):
+    # integer (or bool) param value to string - small values taken from QSIM_INT_STR
+    try:
+        if 0 <= val < QSIM_INT_STR_LEN:
+            return QSIM_INT_STR[val]
+    except TypeError:
+        pass # e.g. None or float - handled as str
+    return str(val)
+
 # --------------------------------------------------------
 
 # ==> qSim access client handling
@@ -70,6 +158,15 @@ class qSim_qcln_access_client():
         self.m_token = None
         self.m_id = id_mnem
         self.m_counter = 1
+        self.m_batch_ops = None # queued transformations - see begin_batch
+        self.m_st_bin = False # binary state values supported by server - see connect
+        self.m_async_pending = {} # in-flight async requests futures, by counter
+        self.m_async_reader = None # async responses reader task
+        self.m_async_tx_lock = None # async requests sending lock
+        self.m_tx_queue = [] # encoded requests to be sent - see queue_request_message and flush
+        self.m_token_param = '' # encoded token param, prefixed to all requests - see connect
+        self.m_rx_msg = qasm.qSim_qcln_qasm() # response message, reused - see receive_response_message
+        self.m_trf_cache = {} # encoded transformation request params, by call args - see qreg_state_transform
         
         self.m_verbose = verbose
     
@@ -79,8 +176,11 @@ class qSim_qcln_access_client():
         # setup connection to qSim server
         # and perform client registration for getting the token
 
-        # reset token
+        # reset token and capabilities
         self.m_token = None
+        self.m_token_param = ''
+        self.m_trf_cache.clear()
+        self.m_st_bin = False
 
         # socket client setup
         self.m_qsock = qsock.qSim_qcln_socket()
@@ -91,22 +191,16 @@ class qSim_qcln_access_client():
         # client registration
 
         # (1) send request
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = 0 # not used here
-        msg_reg.m_id = qasm.QASM_MSG_ID_REGISTER
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_ID, self.m_id)
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
+        self.send_request_message(qasm.QASM_MSG_ID_REGISTER, 
+                                  ((qasm.QASM_MSG_PARAM_TAG_ID, self.m_id),
+                                   (qasm.QASM_MSG_PARAM_TAG_CAPS, qasm.QASM_MSG_PARAM_VAL_CAPS_STBIN)), 
+                                  counter=0) # counter not used here
         if self.m_verbose:
             print('qSim-access - registration request sent - id:', self.m_id)
-            msg_reg.dump()
-            print('raw_msg:', raw_msg)
             print()
 
         # (2) read response 
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
+        msg_res, raw_msg = self.receive_response_message()
         if self.m_verbose:
             print('qSim-access - server registration response received')
             msg_res.dump()
@@ -118,32 +212,41 @@ class qSim_qcln_access_client():
         if res:
             # request ok - get token
             self.m_token = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_TOKEN)
+            self.m_token_param = qasm.qSim_qcln_qasm.encode_param(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
+            self.m_trf_cache.clear()
+            # binary state values only if server supports them (older servers return no caps)
+            caps = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_CAPS)
+            self.m_st_bin = (not caps is None and 
+                             qasm.QASM_MSG_PARAM_VAL_CAPS_STBIN in caps.split(qasm.QASM_MSG_PARAM_VAL_CAPS_SEP))
             if self.m_verbose:
-                print('qSim-access - registration OK - token:', self.m_token)
+                print('qSim-access - registration OK - token:', self.m_token, '- binary states:', self.m_st_bin)
         return res
     
-    def disconnect(self):
+    def disconnect(self, wait_ack=True):
         # deregister client from server and perform connection release 
+        # -> server acknowledge read only if wait_ack set - if not, connection 
+        #    half-closed right after the request and the server fails writing it
 
         # client deregistration
 
         # (1) send request
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = 0 # not used here
-        msg_reg.m_id = qasm.QASM_MSG_ID_UNREGISTER
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
+        self.send_request_message(qasm.QASM_MSG_ID_UNREGISTER, 
+                                  (), 
+                                  counter=0) # counter not used here
         if self.m_verbose:
             print('qSim-access - deregistration request sent - token:', self.m_token)
 
         # reset token
         self.m_token = None
+        self.m_token_param = ''
+        self.m_trf_cache.clear()
         
-        # (2) read response for a clean disconnection - not mandatory
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
+        # (2) read response for a clean disconnection - or signal end of 
+        #     transmission if not waiting for it
+        if wait_ack:
+            self.receive_response_message()
+        else:
+            self.m_qsock.shutdown()
 
         # socket client release
         self.m_qsock.disconnect() 
@@ -162,21 +265,13 @@ class qSim_qcln_access_client():
         # allocate qureg of given size
         
         # send message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_ALLOCATE
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_QN, str(qn))
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
-        self.m_counter += 1
+        self.send_request_message(qasm.QASM_MSG_ID_QREG_ALLOCATE, 
+                                  ((qasm.QASM_MSG_PARAM_TAG_QREG_QN, int_2_string(qn)),))
         if self.m_verbose:
             print('qSim-access - qureg allocation request sent - qn:', qn)
         
         # receive response
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
+        msg_res, _ = self.receive_response_message()
         res = self.check_response_message(msg_res)
         if res:
             # request ok - get qreg handler
@@ -194,22 +289,13 @@ class qSim_qcln_access_client():
         # release given qureg handler
         
         # send message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_RELEASE
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
-        self.m_counter += 1
+        self.send_request_message(qasm.QASM_MSG_ID_QREG_RELEASE, 
+                                  ((qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h)),))
         if self.m_verbose:
             print('qSim-access - qureg release request sent - qr_h:', qr_h)
         
         # receive response
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
-        res = self.check_response_message(msg_res)
+        res, _ = self.receive_response_result()
         if res:
             # request ok 
             if self.m_verbose:
@@ -222,22 +308,13 @@ class qSim_qcln_access_client():
         # reset state for given qureg handler
         
         # send message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_ST_RESET
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
-        self.m_counter += 1
+        self.send_request_message(qasm.QASM_MSG_ID_QREG_ST_RESET, 
+                                  ((qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h)),))
         if self.m_verbose:
             print('qSim-access - qureg state reset request sent - qr_h:', qr_h)
         
         # receive response
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
-        res = self.check_response_message(msg_res)
+        res, _ = self.receive_response_result()
         if res:
             # request ok 
             if self.m_verbose:
@@ -250,29 +327,24 @@ class qSim_qcln_access_client():
         # set state for given qureg handler
         
         # send message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_ST_SET
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
+        params = [(qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h))]
         if not st_idx is None:
-            st_idx_str = str(st_idx)
-            msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_STIDX, st_idx_str)            
+            st_idx_str = int_2_string(st_idx)
+            params.append((qasm.QASM_MSG_PARAM_TAG_QREG_STIDX, st_idx_str))
         elif not st_vals is None:
-            st_vals_str = self.states_complex_2_string(st_vals)
-            # print('st_vals:', st_vals, '-> st_vals_str:', st_vals_str)
-            msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_STVALS, st_vals_str)
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
-        self.m_counter += 1
+            if self.m_st_bin:
+                st_vals_str = self.states_complex_2_binary_string(st_vals)
+                params.append((qasm.QASM_MSG_PARAM_TAG_QREG_STVALS_BIN, st_vals_str))
+            else:
+                st_vals_str = self.states_complex_2_string(st_vals)
+                # print('st_vals:', st_vals, '-> st_vals_str:', st_vals_str)
+                params.append((qasm.QASM_MSG_PARAM_TAG_QREG_STVALS, st_vals_str))
+        self.send_request_message(qasm.QASM_MSG_ID_QREG_ST_SET, params)
         if self.m_verbose:
             print('qSim-access - qureg state set request sent - qr_h:', qr_h)
         
         # receive response
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
-        res = self.check_response_message(msg_res)
+        res, _ = self.receive_response_result()
         if res:
             # request ok 
             if self.m_verbose:
@@ -284,47 +356,243 @@ class qSim_qcln_access_client():
     def qreg_state_transform(self, qr_h, f_type, f_size, f_rep, f_lsq, f_crng=[], f_trng=[], f_args=None, 
                              fu_type=qasm.QASM_F_TYPE_NULL, fu_size=0, diag=False):
         # print('qreg_state_transform...f_args:', f_args)
+        if not self.m_batch_ops is None:
+            # batch open - queue transformation, sent by end_batch
+            op_params = self.state_transform_params(f_type, f_size, f_rep, f_lsq, f_crng, f_trng, f_args, fu_type, fu_size)
+            self.m_batch_ops.append((qr_h, qasm.qSim_qcln_qasm.encode_op(op_params)))
+            if not diag:
+                return True
+            else:
+                return True, (0, 0)
+        
+        # prepare message - encoded params taken from cache for repeated transformations
+        # -> not cached if args not hashable (e.g. nested lists)
+        try:
+            trf_key = (qr_h, f_type, f_size, f_rep, f_lsq, fu_type, fu_size, tuple(f_crng), tuple(f_trng),
+                       None if f_args is None else tuple(f_args))
+            params_bytes = self.m_trf_cache.get(trf_key)
+        except TypeError:
+            trf_key = None
+            params_bytes = None
+        if params_bytes is None:
+            params = [(qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h))] + \
+                     self.state_transform_params(f_type, f_size, f_rep, f_lsq, f_crng, f_trng, f_args, fu_type, fu_size)
+            params_bytes = qasm.qSim_qcln_qasm.encode_params(params, self.m_token_param).encode()
+            if not trf_key is None:
+                if len(self.m_trf_cache) >= QSIM_TRF_CACHE_LEN:
+                    self.m_trf_cache.clear()
+                self.m_trf_cache[trf_key] = params_bytes
+        
+        # send message
+        msg_len = self.send_request_params_bytes(qasm.QASM_MSG_ID_QREG_ST_TRANSFORM, params_bytes)
+        
+        # receive response
+        res, raw_msg2 = self.receive_response_result()
+        if self.m_verbose:
+            # diagnostics in one go - hot path
+            print('qSim-access - qureg state transformation request sent - qr_h:', qr_h)
+            if res:
+                print('qSim-access - qreg state transformation OK')
+        if not diag:
+            return res
+        else:            
+            return res, (msg_len, len(raw_msg2))
+
+    def state_transform_params(self, f_type, f_size, f_rep, f_lsq, f_crng=[], f_trng=[], f_args=None, 
+                               fu_type=qasm.QASM_F_TYPE_NULL, fu_size=0):
+        # build transformation (tag, value) pairs - token and qureg handler excluded
         if qasm.QASM_F_IS_Q2(fu_type):
             # remove arg #3 (qureg size - not needed for QASM!!)
             f_args = f_args[:2]
         
-        # prepare message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_ST_TRANSFORM
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_TYPE, str(f_type))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_SIZE, str(f_size))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_REP, str(f_rep))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_LSQ, str(f_lsq))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_CRANGE, self.index_range_to_string(f_crng))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_TRANGE, self.index_range_to_string(f_trng))
+        params = [(qasm.QASM_MSG_PARAM_TAG_F_TYPE, int_2_string(f_type)),
+                  (qasm.QASM_MSG_PARAM_TAG_F_SIZE, int_2_string(f_size)),
+                  (qasm.QASM_MSG_PARAM_TAG_F_REP, int_2_string(f_rep)),
+                  (qasm.QASM_MSG_PARAM_TAG_F_LSQ, int_2_string(f_lsq)),
+                  (qasm.QASM_MSG_PARAM_TAG_F_CRANGE, self.index_range_to_string(f_crng)),
+                  (qasm.QASM_MSG_PARAM_TAG_F_TRANGE, self.index_range_to_string(f_trng))]
         if fu_type != qasm.QASM_F_TYPE_NULL:
-            msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_UTYPE, str(fu_type))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_ARGS, self.fargs_to_string(f_args, f_type, fu_type))
+            params.append((qasm.QASM_MSG_PARAM_TAG_F_UTYPE, int_2_string(fu_type)))
+        params.append((qasm.QASM_MSG_PARAM_TAG_F_ARGS, self.fargs_to_string(f_args, f_type, fu_type)))
+        return params
+    
+    # -------
+
+    def qreg_state_transform_batch(self, qr_h, gate_list, diag=False):
+        # apply a sequence of transformations to given qureg handler using a single request
+        # -> each gate given as (f_type, f_size, f_rep, f_lsq, f_crng, f_trng, f_args, fu_type, fu_size)
+        #    tuple, with optional trailing items as per qreg_state_transform
+        ops = [qasm.qSim_qcln_qasm.encode_op(self.state_transform_params(*gate)) for gate in gate_list]
+        return self.send_transform_batch(qr_h, ops, diag)
+
+    def begin_batch(self):
+        # start queuing the qureg state transformations - sent by end_batch
+        # -> queued transformations also sent before any other request (order kept)
+        if self.m_batch_ops is None:
+            self.m_batch_ops = []
+
+    def end_batch(self, diag=False):
+        # send the queued qureg state transformations and close the batch
+        # -> nothing sent if no batch open
+        if self.m_batch_ops is None:
+            res = True
+            msg_sz = (0, 0)
+        else:
+            res, msg_sz = self.send_batch_ops()
+            self.m_batch_ops = None
+        if not diag:
+            return res
+        else:            
+            return res, msg_sz
+
+    @contextlib.contextmanager
+    def batch(self):
+        # qureg state transformations batch as a context - queued transformations 
+        # sent on exit, discarded on exception (batch closed in both cases)
+        self.begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self.m_batch_ops = None
+            raise
+        self.end_batch()
+
+    def send_batch_ops(self):
+        # send the queued qureg state transformations, batch left open and emptied
+        # -> consecutive transformations on the same qureg sent together
+        batch_ops = self.m_batch_ops
+        self.m_batch_ops = []
         
-        # send message
-        raw_msg1 = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg1)
-        self.m_counter += 1
-        if self.m_verbose:
-            print('qSim-access - qureg state transformation request sent - qr_h:', qr_h)
-            print('raw_msg:', raw_msg1)
+        res = True
+        msg_sz = (0, 0)
+        i = 0
+        while res and (i < len(batch_ops)):
+            qr_h = batch_ops[i][0]
+            j = i + 1
+            while (j < len(batch_ops)) and (batch_ops[j][0] == qr_h):
+                j += 1
+            res, diag_j = self.send_transform_batch(qr_h, [op for _, op in batch_ops[i:j]], diag=True)
+            msg_sz = (msg_sz[0] + diag_j[0], msg_sz[1] + diag_j[1])
+            i = j
+        return res, msg_sz
+
+    def send_transform_batch(self, qr_h, ops, diag=False):
+        # send given encoded transformations for given qureg handler and check the response
+        # -> transformations split over more requests if exceeding the max message length,
+        #    stopping at first failed request
+        ops_max_len = qsock.QSIM_MSG_MAX_LEN - QSIM_BATCH_MSG_HDR_LEN
+        ops_chunks = []
+        ops_chunk = []
+        ops_len = 0
+        for op in ops:
+            if (len(ops_chunk) > 0) and (ops_len + len(op) + 1 > ops_max_len):
+                ops_chunks.append(ops_chunk)
+                ops_chunk = []
+                ops_len = 0
+            ops_chunk.append(op)
+            ops_len += len(op) + 1
+        if len(ops_chunk) > 0:
+            ops_chunks.append(ops_chunk)
         
-        # receive response
-        raw_msg2 = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg2)
-        res = self.check_response_message(msg_res)
-        if res:
-            # request ok 
+        res = True
+        msg_sz = (0, 0)
+        for ops_chunk in ops_chunks:
+            # send message
+            msg_len = self.send_request_message(qasm.QASM_MSG_ID_QREG_ST_TRANSFORM_BATCH, 
+                                                ((qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h)),
+                                                 (qasm.QASM_MSG_PARAM_TAG_F_OPS, qasm.QASM_MSG_OPS_SEP.join(ops_chunk))))
             if self.m_verbose:
-                print('qSim-access - qreg state transformation OK')
+                print('qSim-access - qureg state batch transformation request sent - qr_h:', qr_h, 'ops:', len(ops_chunk))
+            
+            # receive response
+            res, raw_msg2 = self.receive_response_result()
+            msg_sz = (msg_sz[0] + msg_len, msg_sz[1] + len(raw_msg2))
+            if not res:
+                break
+            if self.m_verbose:
+                print('qSim-access - qreg state batch transformation OK')
+        if not diag:
+            return res
+        else:            
+            return res, msg_sz
+    
+    def qreg_state_transform_pipelined(self, qr_h, gate_list, diag=False):
+        # apply a sequence of transformations to given qureg handler with one request each, 
+        # sent back-to-back before reading their responses (single round trip per block)
+        # -> gates given as per qreg_state_transform_batch
+        # -> requests sent in blocks of up to QSIM_PIPE_MAX_OPS, so that unread responses 
+        #    never exceed the socket buffers (deadlock otherwise)
+        # -> all responses read, also after a failed one, each checked against its request counter
+        qr_h_str = int_2_string(qr_h)
+        res = True
+        msg_len = 0
+        msg_len2 = 0
+        for i in range(0, len(gate_list), QSIM_PIPE_MAX_OPS):
+            counters = [self.queue_request_message(qasm.QASM_MSG_ID_QREG_ST_TRANSFORM, 
+                                                   [(qasm.QASM_MSG_PARAM_TAG_QREG_H, qr_h_str)] + self.state_transform_params(*gate))
+                        for gate in gate_list[i:i + QSIM_PIPE_MAX_OPS]]
+            msg_len += sum(map(len, self.m_tx_queue))
+            self.flush()
+            if self.m_verbose:
+                print('qSim-access - qureg state pipelined transformation requests sent - qr_h:', qr_h, 'ops:', len(counters))
+            
+            # receive responses
+            for counter in counters:
+                res_i, raw_msg2 = self.receive_counter_response_result(counter)
+                res = res and res_i
+                msg_len2 += len(raw_msg2)
+        if not diag:
+            return res
+        else:            
+            return res, (msg_len, msg_len2)
+    
+    def qreg_state_transform_windowed(self, qr_h, gate_list, window=2, diag=False):
+        # apply a sequence of transformations to given qureg handler with one request each, 
+        # keeping up to window requests in flight - next request encoded and sent as soon 
+        # as the oldest response is read (client encoding overlapped with server processing)
+        # -> gates given as per qreg_state_transform_batch
+        # -> all responses read, also after a failed one, each checked against its request counter
+        qr_h_str = int_2_string(qr_h)
+        res = True
+        msg_len = 0
+        msg_len2 = 0
+        counters = []
+        for n_rcvd in range(len(gate_list)):
+            # fill the window
+            while (len(counters) < len(gate_list)) and (len(counters) - n_rcvd < window):
+                msg_len += self.send_request_message(qasm.QASM_MSG_ID_QREG_ST_TRANSFORM, 
+                                                     [(qasm.QASM_MSG_PARAM_TAG_QREG_H, qr_h_str)] + 
+                                                     self.state_transform_params(*gate_list[len(counters)]))
+                counters.append(self.m_counter - 1) # counter just used
+            
+            # receive oldest response
+            res_i, raw_msg2 = self.receive_counter_response_result(counters[n_rcvd])
+            res = res and res_i
+            msg_len2 += len(raw_msg2)
+        if self.m_verbose:
+            print('qSim-access - qureg state windowed transformations done - qr_h:', qr_h, 'ops:', len(gate_list))
         if not diag:
             return res
         else:            
-            return res, (len(raw_msg1), len(raw_msg2))
+            return res, (msg_len, msg_len2)
+    
+    # -------
+
+    async def qreg_state_transform_async(self, qr_h, f_type, f_size, f_rep, f_lsq, f_crng=[], f_trng=[], f_args=None, 
+                                         fu_type=qasm.QASM_F_TYPE_NULL, fu_size=0):
+        # asyncio version of qreg_state_transform - many transformations can be in-flight 
+        # at the same time, e.g. via asyncio.gather(), without waiting on each response
+        # 
+        # Note: sync methods not to be used while async requests are pending
+        params = [(qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h))] + \
+                 self.state_transform_params(f_type, f_size, f_rep, f_lsq, f_crng, f_trng, f_args, fu_type, fu_size)
+        msg_res = await self.send_request_message_async(qasm.QASM_MSG_ID_QREG_ST_TRANSFORM, params)
+        res = self.check_response_message(msg_res)
+        if res:
+            # request ok 
+            if self.m_verbose:
+                print('qSim-access - qreg state async transformation OK')
+        return res
     
     # -------
     
@@ -332,30 +600,20 @@ class qSim_qcln_access_client():
         # print('qreg_state_transform_qml...f_vec:', f_vec)
         
         # prepare message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_ST_TRANSFORM
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_TYPE, str(f_type))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_FBQML_REP, str(f_rep))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_FBQML_ENTANG, str(f_entang))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_FBQML_SUBTYPE, str(f_subtype))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_F_ARGS, self.fargs_to_string(f_args, f_type, qasm.QASM_F_TYPE_NULL))
+        params = ((qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h)),
+                  (qasm.QASM_MSG_PARAM_TAG_F_TYPE, int_2_string(f_type)),
+                  (qasm.QASM_MSG_PARAM_TAG_FBQML_REP, int_2_string(f_rep)),
+                  (qasm.QASM_MSG_PARAM_TAG_FBQML_ENTANG, int_2_string(f_entang)),
+                  (qasm.QASM_MSG_PARAM_TAG_FBQML_SUBTYPE, int_2_string(f_subtype)),
+                  (qasm.QASM_MSG_PARAM_TAG_F_ARGS, self.fargs_to_string(f_args, f_type, qasm.QASM_F_TYPE_NULL)))
         
         # send message
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
-        self.m_counter += 1
+        self.send_request_message(qasm.QASM_MSG_ID_QREG_ST_TRANSFORM, params)
         if self.m_verbose:
             print('qSim-access - qureg state QML transformation request sent - qr_h:', qr_h)
-            print('raw_msg:', raw_msg)
         
         # receive response
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
-        res = self.check_response_message(msg_res)
+        res, _ = self.receive_response_result()
         if res:
             # request ok 
             if self.m_verbose:
@@ -368,29 +626,27 @@ class qSim_qcln_access_client():
         # get state values for given qureg handler
         
         # send message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_ST_PEEK
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
-        self.m_counter += 1
+        params = [(qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h))]
+        if self.m_st_bin:
+            # ask for binary state values
+            params.append((qasm.QASM_MSG_PARAM_TAG_QREG_STVALS_BIN, '1'))
+        self.send_request_message(qasm.QASM_MSG_ID_QREG_ST_PEEK, params)
         if self.m_verbose:
             print('qSim-access - qureg state get values request sent - qr_h:', qr_h)
         
         # receive response
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
+        msg_res, _ = self.receive_response_message()
         # msg_res.dump()
         res = self.check_response_message(msg_res)
         if res:
-            # request ok - get qreg state values
-            qr_st_str = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_QREG_STVALS)
-            # print(qr_st_str)
-            # convert to complex array
-            qr_st = self.states_string_2_complex(qr_st_str)
+            # request ok - get qreg state values and convert to complex array
+            qr_st_str = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_QREG_STVALS_BIN)
+            if not qr_st_str is None:
+                qr_st = self.states_binary_string_2_complex(qr_st_str)
+            else:
+                qr_st_str = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_QREG_STVALS)
+                # print(qr_st_str)
+                qr_st = self.states_string_2_complex(qr_st_str)
             if self.m_verbose:
                 print('qSim-access - qreg state get values OK')
         else:
@@ -403,25 +659,20 @@ class qSim_qcln_access_client():
         # state measurement for given qureg handler
         
         # send message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_MEASURE
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_MQIDX, str(q_idx))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_MQLEN, str(q_len))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_MRAND, str(int(m_rand)))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_MCOLL, str(int(st_coll)))
-        raw_msg1 = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg1)
-        self.m_counter += 1
+        params = [(qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h)),
+                  (qasm.QASM_MSG_PARAM_TAG_QREG_MQIDX, int_2_string(q_idx)),
+                  (qasm.QASM_MSG_PARAM_TAG_QREG_MQLEN, int_2_string(q_len)),
+                  (qasm.QASM_MSG_PARAM_TAG_QREG_MRAND, int_2_string(int(m_rand))),
+                  (qasm.QASM_MSG_PARAM_TAG_QREG_MCOLL, int_2_string(int(st_coll)))]
+        if self.m_st_bin:
+            # ask for binary measured state indexes
+            params.append((qasm.QASM_MSG_PARAM_TAG_QREG_MSTIDXS_BIN, '1'))
+        msg_len = self.send_request_message(qasm.QASM_MSG_ID_QREG_MEASURE, params)
         if self.m_verbose:
             print('qSim-access - qureg state get values request sent - qr_h:', qr_h)
         
         # receive response
-        raw_msg2 = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg2)
+        msg_res, raw_msg2 = self.receive_response_message()
         res = self.check_response_message(msg_res)
         if res:
             # request ok - get qreg measurement values
@@ -438,13 +689,17 @@ class qSim_qcln_access_client():
             else:
                 m_pr = None
             
-            # measurement residual qureg states - optional - convert to double array
-            m_vec_str = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_QREG_MSTIDXS)
-            # print('m_exp_str:', m_vec_str)
+            # measurement residual qureg states - optional - convert to int list
+            m_vec_str = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_QREG_MSTIDXS_BIN)
             if not m_vec_str is None:
-                m_vec = eval(m_vec_str)
+                m_vec = self.indexes_binary_string_2_list(m_vec_str)
             else:
-                m_vec = None
+                m_vec_str = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_QREG_MSTIDXS)
+                # print('m_exp_str:', m_vec_str)
+                if not m_vec_str is None:
+                    m_vec = ast.literal_eval(m_vec_str)
+                else:
+                    m_vec = None
 
             if self.m_verbose:
                 print('qSim-access - qreg measurement OK - m_st:', m_st)
@@ -455,7 +710,7 @@ class qSim_qcln_access_client():
         if not diag:
             return m_st, m_pr, m_vec
         else:            
-            return m_st, m_pr, m_vec, (len(raw_msg1), len(raw_msg2))
+            return m_st, m_pr, m_vec, (msg_len, len(raw_msg2))
             
     # -------
     
@@ -467,25 +722,17 @@ class qSim_qcln_access_client():
             st_idx = -1            
         
         # send message
-        msg_reg = qasm.qSim_qcln_qasm()
-        msg_reg.m_counter = self.m_counter
-        msg_reg.m_id = qasm.QASM_MSG_ID_QREG_EXPECT
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_TOKEN, self.m_token)
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_H, str(qr_h))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_ESTIDX, str(st_idx))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_EQIDX, str(q_idx))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_EQLEN, str(q_len))
-        msg_reg.add_param_tagValue(qasm.QASM_MSG_PARAM_TAG_QREG_EOBSOP, str(q_obs_op))
-        raw_msg = msg_reg.to_raw_message()
-        self.m_qsock.send_raw_message(raw_msg)
-        self.m_counter += 1
+        self.send_request_message(qasm.QASM_MSG_ID_QREG_EXPECT, 
+                                  ((qasm.QASM_MSG_PARAM_TAG_QREG_H, int_2_string(qr_h)),
+                                   (qasm.QASM_MSG_PARAM_TAG_QREG_ESTIDX, int_2_string(st_idx)),
+                                   (qasm.QASM_MSG_PARAM_TAG_QREG_EQIDX, int_2_string(q_idx)),
+                                   (qasm.QASM_MSG_PARAM_TAG_QREG_EQLEN, int_2_string(q_len)),
+                                   (qasm.QASM_MSG_PARAM_TAG_QREG_EOBSOP, int_2_string(q_obs_op))))
         if self.m_verbose:
             print('qSim-access - qureg state get values request sent - qr_h:', qr_h)
         
         # receive response
-        raw_msg = self.m_qsock.receive_raw_message()
-        msg_res = qasm.qSim_qcln_qasm()
-        msg_res.from_raw_message(raw_msg)
+        msg_res, _ = self.receive_response_message()
         res = self.check_response_message(msg_res)
         if res:
             # request ok - get qreg expectation values
@@ -500,9 +747,163 @@ class qSim_qcln_access_client():
             m_exp = None
         return m_exp
             
+    # -------------------------
+    # message exchange methods
+
+    def send_request_message(self, msg_id, params, counter=None):
+        # encode request message from given (tag, value) pairs and send it, returning the 
+        # message length - length field and encoded bytes sent in one go, no copy
+        # -> client counter used and incremented if no counter given
+        # -> queued batch transformations sent first, if any
+        if self.m_batch_ops:
+            self.send_batch_ops()
+        if counter is None:
+            counter = self.m_counter
+            self.m_counter += 1
+        raw_msg = qasm.qSim_qcln_qasm.encode_raw_message(counter, msg_id, params, self.m_token_param).encode()
+        self.m_qsock.send_raw_messages((raw_msg,))
+        if self.m_verbose:
+            print('raw_msg:', raw_msg.decode())
+        return len(raw_msg)
+
+    def send_request_params_bytes(self, msg_id, params_bytes):
+        # send request message with given pre-encoded params (token included), 
+        # returning the message length - client counter used and incremented
+        counter = self.m_counter
+        self.m_counter += 1
+        msg_hdr = b'%d|%d|' % (counter, msg_id)
+        msg_len = self.m_qsock.send_raw_message_parts(msg_hdr, params_bytes)
+        if self.m_verbose:
+            print('raw_msg:', (msg_hdr + params_bytes).decode())
+        return msg_len
+
+    def receive_response_message(self):
+        # read response message and decode it
+        # -> response message instance reused, valid until next response
+        raw_msg = self.m_qsock.receive_raw_message()
+        msg_res = self.m_rx_msg
+        msg_res.reset()
+        msg_res.from_raw_message(raw_msg)
+        return msg_res, raw_msg
+    
+    def queue_request_message(self, msg_id, params):
+        # encode request message from given (tag, value) pairs and queue it, 
+        # to be sent with the other queued ones by flush - returning its counter
+        # -> queued batch transformations sent first, if any
+        if self.m_batch_ops:
+            self.send_batch_ops()
+        counter = self.m_counter
+        self.m_counter += 1
+        self.m_tx_queue.append(qasm.qSim_qcln_qasm.encode_raw_message(counter, msg_id, params, self.m_token_param).encode())
+        if not self.m_async_reader is None and not self.m_async_reader.done():
+            # async requests in flight - response delivered to a pending future (as per 
+            # send_request_message_async) and queue sent right away, no flush needed
+            loop = asyncio.get_running_loop()
+            self.m_async_pending[counter] = loop.create_future()
+            if len(self.m_tx_queue) == 1:
+                loop.create_task(self.flush_async())
+        return counter
+    
+    def flush(self):
+        # send all queued request messages in one go
+        # -> responses to be read by receive_response_message, in the same order
+        if len(self.m_tx_queue) > 0:
+            self.m_qsock.send_raw_messages(self.m_tx_queue)
+            self.m_tx_queue = []
+    
+    async def send_request_message_async(self, msg_id, params):
+        # send request and wait for its response, matched by counter and 
+        # delivered by the responses reader task
+        loop = asyncio.get_running_loop()
+        if self.m_async_reader is None or self.m_async_reader.done():
+            # no reader running - queued batch transformations sent first (if any), 
+            # then socket switched to async mode and reader started
+            if self.m_batch_ops:
+                self.send_batch_ops()
+            self.m_qsock.set_async_mode(True)
+            self.m_async_tx_lock = asyncio.Lock()
+            self.m_async_reader = loop.create_task(self.receive_response_messages_async())
+            self.m_async_reader.add_done_callback(self.receive_response_messages_done)
+        
+        counter = self.m_counter
+        self.m_counter += 1
+        msg_fut = loop.create_future()
+        self.m_async_pending[counter] = msg_fut
+        self.m_tx_queue.append(qasm.qSim_qcln_qasm.encode_raw_message(counter, msg_id, params, self.m_token_param).encode())
+        if len(self.m_tx_queue) == 1:
+            # first queued request - let the other ready tasks queue theirs, 
+            # then send them all in one go
+            await asyncio.sleep(0)
+            await self.flush_async()
+        return await msg_fut
+    
+    async def flush_async(self):
+        # send all queued request messages in one go - async version of flush
+        async with self.m_async_tx_lock:
+            if len(self.m_tx_queue) > 0:
+                msg_list = self.m_tx_queue
+                self.m_tx_queue = []
+                await self.m_qsock.send_raw_messages_async(msg_list)
+    
+    async def receive_response_messages_async(self):
+        # read responses while requests are pending and resolve their futures by counter
+        # -> a response not matching any pending request fails all of them (exchange out of sync)
+        # -> socket back to sync mode when done
+        try:
+            while self.m_async_pending:
+                raw_msg = await self.m_qsock.receive_raw_message_async()
+                msg_res = qasm.qSim_qcln_qasm()
+                msg_res.from_raw_message(raw_msg)
+                msg_fut = self.m_async_pending.pop(msg_res.m_counter, None)
+                if msg_fut is None:
+                    raise ConnectionError('qSim-access - unexpected response counter: ' + str(msg_res.m_counter))
+                if not msg_fut.done():
+                    msg_fut.set_result(msg_res)
+        except Exception as e:
+            # fail all pending requests
+            for msg_fut in self.m_async_pending.values():
+                if not msg_fut.done():
+                    msg_fut.set_exception(e)
+            self.m_async_pending.clear()
+        finally:
+            self.m_qsock.set_async_mode(False)
+
+    def receive_response_messages_done(self, reader):
+        # responses reader task done - if cancelled (also before running) fail all pending 
+        # requests, as no response will be delivered, and socket back to sync mode
+        if reader.cancelled():
+            for msg_fut in self.m_async_pending.values():
+                if not msg_fut.done():
+                    msg_fut.set_exception(ConnectionError('qSim-access - responses reader cancelled'))
+            self.m_async_pending.clear()
+            self.m_qsock.set_async_mode(False)
+
     # -------------------------
     # helper methods
 
+    def receive_response_result(self):
+        # read response message and check its return code only - no decoding when ok
+        # -> for responses not carrying other values than the return code
+        raw_msg = self.m_qsock.receive_raw_message()
+        idx = raw_msg.find(QSIM_RESULT_OK_PARAM)
+        if (idx > 0) and (raw_msg[idx - 1] in QSIM_RESULT_OK_PARAM_PREV):
+            return True, raw_msg
+        
+        # not ok - decode it for getting the error
+        msg_res = self.m_rx_msg
+        msg_res.reset()
+        msg_res.from_raw_message(raw_msg)
+        return self.check_response_message(msg_res), raw_msg
+
+    def receive_counter_response_result(self, counter):
+        # read response message for the request with given counter and check its return code
+        # -> responses out of order (e.g. request rejected by an older server) raising an error
+        res, raw_msg = self.receive_response_result()
+        if raw_msg.partition(qasm.QASM_MSG_FIELD_SEP)[0] != int_2_string(counter):
+            raise ConnectionError('qSim-access - unexpected response counter - expected: ' + int_2_string(counter) + 
+                                  ' - raw_msg: ' + raw_msg[:64])
+        return res, raw_msg
+
     def check_response_message(self, msg_res):
         # extract and check response return code
         res = msg_res.get_param_valueByTag(qasm.QASM_MSG_PARAM_TAG_RESULT)
@@ -518,37 +919,44 @@ class qSim_qcln_access_client():
     
     @staticmethod
     def states_string_2_complex(qr_st_str):
-        qr_st_tk = qr_st_str.split(',')
-        qr_st = []
-        for i in range(0, len(qr_st_tk), 2):            
-            tk_i0 = qr_st_tk[i].strip()
-            tk_i1 = qr_st_tk[i+1].strip()
-            # print(i, tk_i0, tk_i1)
-            st_r = eval(tk_i0[1:])
-            st_i = eval(tk_i1[:-1])
-            # print('...', st_r, st_i)
-            qr_st.append(st_r + st_i*1.j)
-        qr_st = np.array(qr_st, dtype=complex)
-        return qr_st
+        # parse all real/imag values in one go, as a flat double array, and 
+        # view them as complex pairs
+        # -> delimiters removed in a single pass, values parsed by a single numpy pass (no lists)
+        qr_st_str = qr_st_str.translate(QSIM_ST_VAL_DELIMITERS)
+        if not qr_st_str.strip():
+            return np.empty(0, dtype=np.complex128) # blank string not parsed as empty by numpy
+        return np.fromstring(qr_st_str, dtype=np.float64, sep=' ').view(np.complex128)
     
     @staticmethod
     def states_complex_2_string(qr_st):
-        qr_st_str = ''
-        for st_i in qr_st:
-            qr_st_str += '(' + str(np.real(st_i)) + ', ' + str(np.imag(st_i)) + ') '
-        return qr_st_str
+        # format all real/imag pairs with a single format call 
+        # -> 9 digits precision enough for float values parsed by qSim server
+        qr_st = np.asarray(qr_st, dtype=np.complex128).ravel()
+        # -> formatting python floats quicker than numpy ones
+        return (QSIM_ST_VAL_FORMAT * len(qr_st)) % tuple(qr_st.view(np.float64).tolist())
+
+    @staticmethod
+    def states_binary_string_2_complex(qr_st_str):
+        # base64 encoded little-endian complex128 array
+        return np.frombuffer(base64.b64decode(qr_st_str), dtype='<c16')
+
+    @staticmethod
+    def states_complex_2_binary_string(qr_st):
+        return base64.b64encode(np.asarray(qr_st, dtype='<c16').tobytes()).decode()
+
+    @staticmethod
+    def indexes_binary_string_2_list(idx_str):
+        # base64 encoded little-endian uint32 array
+        return np.frombuffer(base64.b64decode(idx_str), dtype='<u4').tolist()
 
     @staticmethod
     def index_range_to_string(rng_val):
-        if rng_val is None:
-            str_val = '(-1, -1)'
-        elif len(rng_val) == 0:
-            str_val = '(-1, -1)'
-        elif len(rng_val) == 2:
-            str_val = str(tuple(rng_val))
-        else:
-            str_val = '(' + str(rng_val[0]) + ')'
-        return str_val
+        # None or empty range mapped to a constant, explicit formatting otherwise
+        if rng_val is None or len(rng_val) == 0:
+            return QSIM_EMPTY_RANGE
+        if len(rng_val) == 2:
+            return f'({rng_val[0]}, {rng_val[1]})'
+        return f'({rng_val[0]})'
             
     def fargs_to_string(self, fargs, ftype, futype):
         # coding format: ASCII string with "[", "]" as start/stop tags and with "," as field separators
@@ -557,62 +965,78 @@ class qSim_qcln_access_client():
         # with <arg-x> = <value>"|"<type> and 
         # - <value> as <number> for scalar or (<number>, <number>) for range
         # - <type> as "I" for integers or "D" for doubles or "R" for ranges
-        if not fargs is None:
-            # function arguments to handle
-            fargs_str = '[' # starting tag
-            if qasm.QASM_F_IS_Q1(ftype):
-                # single function argument only expected (if any)
-                if len(fargs) > 0:
-                    fargs_str += qSim_qcln_access_client.farg_double_2_string(fargs[0])
-                
-            elif qasm.QASM_F_IS_Q2(ftype):
-                if ftype == qasm.QASM_F_TYPE_CU:
-                    # 1-qubit function-U case 
-                    # -> function-U argument only expected (if any)
-                    if len(fargs) > 0:
-                        fargs_str += qSim_qcln_access_client.farg_double_2_string(fargs[0])
-                else:
-                    # 2-qubit function case - no arguments expected
-                    pass
-
-            elif qasm.QASM_F_IS_Qn(ftype):
-                if qasm.QASM_F_IS_Q1(futype):
-                    # 1-qubit function-U case 
-                    # -> function-U argument only expected (if any)
-                    if len(fargs) > 0:
-                        fargs_str += qSim_qcln_access_client.farg_double_2_string(fargs[0])
-                else:
-                    # 2-qubit function case 
-                    # -> control & target ranges + function-U argument expected
-                    fargs_str += qSim_qcln_access_client.farg_range_2_string(fargs[0])
-                    fargs_str += qSim_qcln_access_client.farg_range_2_string(fargs[1])
-                    if len(fargs) > 2:
-                        fargs_str += qSim_qcln_access_client.farg_double_2_string(fargs[2])
-
-            elif qasm.QASM_FB_IS_BLOCK_QML(ftype):
-                # arguments sequence conversion
-                for farg in fargs:
-                    fargs_str += qSim_qcln_access_client.farg_double_2_string(farg)
-                
-            # ending tag
-            if fargs_str[-1] == ',':
-                fargs_str = fargs_str[:-1] + ']' # skip last ","
-            else:
-                fargs_str += ']'
-                
-        else:
+        if fargs is None:
             # no function arguments - empty string
-            fargs_str = '[]'
+            return '[]'
+        
+        # function arguments to handle - formatter selected once per (ftype, futype)
+        fargs_fmt = QSIM_FARGS_FORMATTERS.get((ftype, futype))
+        if fargs_fmt is None:
+            fargs_fmt = self.fargs_formatter(ftype, futype)
+            QSIM_FARGS_FORMATTERS[(ftype, futype)] = fargs_fmt
+        return fargs_fmt(fargs)
+
+    @staticmethod
+    def fargs_formatter(ftype, futype):
+        # select function arguments formatter for given function and function-U types
+        if qasm.QASM_F_IS_Q1(ftype):
+            # single function argument only expected (if any)
+            return qSim_qcln_access_client.fargs_first_double_2_string
             
-        return fargs_str        
+        elif qasm.QASM_F_IS_Q2(ftype):
+            if ftype == qasm.QASM_F_TYPE_CU:
+                # 1-qubit function-U case 
+                # -> function-U argument only expected (if any)
+                return qSim_qcln_access_client.fargs_first_double_2_string
+            else:
+                # 2-qubit function case - no arguments expected
+                return qSim_qcln_access_client.fargs_none_2_string
+
+        elif qasm.QASM_F_IS_Qn(ftype):
+            if qasm.QASM_F_IS_Q1(futype):
+                # 1-qubit function-U case 
+                # -> function-U argument only expected (if any)
+                return qSim_qcln_access_client.fargs_first_double_2_string
+            else:
+                # 2-qubit function case 
+                # -> control & target ranges + function-U argument expected
+                return qSim_qcln_access_client.fargs_ranges_double_2_string
+
+        elif qasm.QASM_FB_IS_BLOCK_QML(ftype):
+            # arguments sequence conversion
+            return qSim_qcln_access_client.fargs_doubles_2_string
+        
+        return qSim_qcln_access_client.fargs_none_2_string
+
+    @staticmethod
+    def fargs_none_2_string(fargs):
+        return '[]'
+
+    @staticmethod
+    def fargs_first_double_2_string(fargs):
+        if len(fargs) > 0:
+            return '[' + qSim_qcln_access_client.farg_double_2_string(fargs[0]) + ']'
+        return '[]'
+
+    @staticmethod
+    def fargs_ranges_double_2_string(fargs):
+        fargs_str = [qSim_qcln_access_client.farg_range_2_string(fargs[0]),
+                     qSim_qcln_access_client.farg_range_2_string(fargs[1])]
+        if len(fargs) > 2:
+            fargs_str.append(qSim_qcln_access_client.farg_double_2_string(fargs[2]))
+        return '[' + ','.join(fargs_str) + ']'
+
+    @staticmethod
+    def fargs_doubles_2_string(fargs):
+        return '[' + ','.join([str(farg) + '|D' for farg in fargs]) + ']'
 
     @staticmethod
     def farg_double_2_string(farg_val):
-        return str(farg_val) + '|D,'
+        return str(farg_val) + '|D'
 
     @staticmethod
     def farg_range_2_string(farg_rng):
-        return qSim_qcln_access_client.index_range_to_string(farg_rng)+'|R,'
+        return qSim_qcln_access_client.index_range_to_string(farg_rng) + '|R'
 
 
 #######################################################################
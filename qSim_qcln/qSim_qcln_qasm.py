@@ -41,6 +41,19 @@ Created on Sat May 28 17:46:04 2022
 * 1.2   Feb-2023  Added macro to identify 1-qubit parametric q-functions.
 *                 Supported qureg state expectations calculation.
 *                 Handled QML function blocks (feature map and q-net).
+* 1.3   Oct-2026  Added direct message encoding from tag/value pairs.
+*                 Supported batched qureg state transformations.
+*                 Added capabilities and binary state values/indexes tags.
+*                 Supported pre-encoded params prefix (e.g. client token).
+*                 Added reset method for reusing message instances.
+*                 Raw message parsing based on string split.
+*                 Raw message encoding based on string join.
+*                 Direct dictionary access for params lookup and dump.
+*                 Precomputed param tag prefixes for message encoding.
+*                 Added params only encoding (e.g. for caching).
+*                 Function type checks as plain comparisons - fixed n-qubit 
+*                 check (always false).
+*                 Message attributes declared as slots.
 * 
 * ------------------------------------------------------------------------
 *
@@ -66,6 +79,7 @@ QASM_MSG_ID_QREG_ST_TRANSFORM = 14
 QASM_MSG_ID_QREG_ST_PEEK      = 15
 QASM_MSG_ID_QREG_MEASURE      = 16
 QASM_MSG_ID_QREG_EXPECT       = 17
+QASM_MSG_ID_QREG_ST_TRANSFORM_BATCH = 18
 
 # responses
 QASM_MSG_ID_RESPONSE = 20
@@ -75,14 +89,20 @@ QASM_MSG_FIELD_SEP  = "|"
 QASM_MSG_PARAM_SEP  = ":"
 QASM_MSG_PARVAL_SEP = "="
 
+# batched operations separators (transformation batch only)
+QASM_MSG_OPS_SEP       = ";"
+QASM_MSG_OPS_PARAM_SEP = "&"
+
 # parameter tags
 QASM_MSG_PARAM_TAG_ID         = "id"
 QASM_MSG_PARAM_TAG_TOKEN      = "token"
+QASM_MSG_PARAM_TAG_CAPS       = "caps"
 
 QASM_MSG_PARAM_TAG_QREG_QN      = "qr_n"
 QASM_MSG_PARAM_TAG_QREG_H       = "qr_h"
 QASM_MSG_PARAM_TAG_QREG_STIDX   = "qr_stIdx"
 QASM_MSG_PARAM_TAG_QREG_STVALS  = "qr_stVals"
+QASM_MSG_PARAM_TAG_QREG_STVALS_BIN = "qr_stValsBin"
 QASM_MSG_PARAM_TAG_QREG_MQIDX   = "qr_mQidx"
 QASM_MSG_PARAM_TAG_QREG_MQLEN   = "qr_mQlen"
 QASM_MSG_PARAM_TAG_QREG_MRAND   = "qr_mRand"
@@ -90,6 +110,7 @@ QASM_MSG_PARAM_TAG_QREG_MCOLL   = "qr_mStColl"
 QASM_MSG_PARAM_TAG_QREG_MSTIDX  = "qr_mStIdx"
 QASM_MSG_PARAM_TAG_QREG_MPR     = "qr_mStPr"
 QASM_MSG_PARAM_TAG_QREG_MSTIDXS = "qr_mStIdxs"
+QASM_MSG_PARAM_TAG_QREG_MSTIDXS_BIN = "qr_mStIdxsBin"
 QASM_MSG_PARAM_TAG_QREG_ESTIDX  = "qr_exStIdx"
 QASM_MSG_PARAM_TAG_QREG_EQIDX   = "qr_exQidx"
 QASM_MSG_PARAM_TAG_QREG_EQLEN   = "qr_exQlen"
@@ -104,6 +125,7 @@ QASM_MSG_PARAM_TAG_F_CRANGE   = "f_cRange"
 QASM_MSG_PARAM_TAG_F_TRANGE   = "f_tRange"
 QASM_MSG_PARAM_TAG_F_UTYPE    = "f_uType"
 QASM_MSG_PARAM_TAG_F_ARGS     = "f_args"
+QASM_MSG_PARAM_TAG_F_OPS      = "f_ops"
 
 QASM_MSG_PARAM_TAG_FBQML_REP      = "fqml_rep"         
 QASM_MSG_PARAM_TAG_FBQML_ENTANG   = "fqml_entang_type" 
@@ -113,10 +135,61 @@ QASM_MSG_PARAM_TAG_FBQML_FMAPVEC  = "fqml_fmap_fvec"
 QASM_MSG_PARAM_TAG_RESULT   = "result"
 QASM_MSG_PARAM_TAG_ERROR    = "error"
 
+# parameter tag prefixes ("<tag>=") - listed for all tags above, 
+# added on first use for any other tag
+class qSim_qcln_qasm_tag_prefix(dict):
+    def __missing__(self, p_tag):
+        p_pfx = p_tag + QASM_MSG_PARVAL_SEP
+        self[p_tag] = p_pfx
+        return p_pfx
+
+QASM_MSG_PARAM_TAG_PREFIX = qSim_qcln_qasm_tag_prefix({p_tag: p_tag + QASM_MSG_PARVAL_SEP for p_tag in (
+    QASM_MSG_PARAM_TAG_ID,
+    QASM_MSG_PARAM_TAG_TOKEN,
+    QASM_MSG_PARAM_TAG_CAPS,
+    QASM_MSG_PARAM_TAG_QREG_QN,
+    QASM_MSG_PARAM_TAG_QREG_H,
+    QASM_MSG_PARAM_TAG_QREG_STIDX,
+    QASM_MSG_PARAM_TAG_QREG_STVALS,
+    QASM_MSG_PARAM_TAG_QREG_STVALS_BIN,
+    QASM_MSG_PARAM_TAG_QREG_MQIDX,
+    QASM_MSG_PARAM_TAG_QREG_MQLEN,
+    QASM_MSG_PARAM_TAG_QREG_MRAND,
+    QASM_MSG_PARAM_TAG_QREG_MCOLL,
+    QASM_MSG_PARAM_TAG_QREG_MSTIDX,
+    QASM_MSG_PARAM_TAG_QREG_MPR,
+    QASM_MSG_PARAM_TAG_QREG_MSTIDXS,
+    QASM_MSG_PARAM_TAG_QREG_MSTIDXS_BIN,
+    QASM_MSG_PARAM_TAG_QREG_ESTIDX,
+    QASM_MSG_PARAM_TAG_QREG_EQIDX,
+    QASM_MSG_PARAM_TAG_QREG_EQLEN,
+    QASM_MSG_PARAM_TAG_QREG_EOBSOP,
+    QASM_MSG_PARAM_TAG_QREG_ESTVAL,
+    QASM_MSG_PARAM_TAG_F_TYPE,
+    QASM_MSG_PARAM_TAG_F_SIZE,
+    QASM_MSG_PARAM_TAG_F_REP,
+    QASM_MSG_PARAM_TAG_F_LSQ,
+    QASM_MSG_PARAM_TAG_F_CRANGE,
+    QASM_MSG_PARAM_TAG_F_TRANGE,
+    QASM_MSG_PARAM_TAG_F_UTYPE,
+    QASM_MSG_PARAM_TAG_F_ARGS,
+    QASM_MSG_PARAM_TAG_F_OPS,
+    QASM_MSG_PARAM_TAG_FBQML_REP,
+    QASM_MSG_PARAM_TAG_FBQML_ENTANG,
+    QASM_MSG_PARAM_TAG_FBQML_SUBTYPE,
+    QASM_MSG_PARAM_TAG_FBQML_FMAPVEC,
+    QASM_MSG_PARAM_TAG_RESULT,
+    QASM_MSG_PARAM_TAG_ERROR,
+    )})
+
 # parameter values
 QASM_MSG_PARAM_VAL_OK  = "Ok"
 QASM_MSG_PARAM_VAL_NOK = "Not-Ok"
 
+# capabilities (comma separated list in caps param)
+QASM_MSG_PARAM_VAL_CAPS_STBIN = "stBin" # binary (base64 encoded complex128) state values
+QASM_MSG_PARAM_VAL_CAPS_SEP   = ","
+
 # --------------------
 
 # function types
@@ -219,22 +292,29 @@ QASM_QML_QNET_TYPE_REAL_AMPL  = 0
 # ==> qSim instruction set handling
 class qSim_qcln_qasm(): 
    
+    # fixed attributes - no per-instance dict
+    __slots__ = ('m_counter', 'm_id', 'm_params_dict')
+    
     def __init__(self):
         # class constructor 
         self.m_counter = 0
         self.m_id = 0
         self.m_params_dict = {}
     
+    def reset(self):
+        # clear counter, id and params - for reusing the instance
+        self.m_counter = 0
+        self.m_id = 0
+        self.m_params_dict.clear()
+    
     # ------------------
     
     def add_param_tagValue(self, par_tag, par_val):
         self.m_params_dict[par_tag] = par_val
 
     def get_param_valueByTag(self, par_tag):
-        if par_tag in self.m_params_dict.keys():
-            return self.m_params_dict[par_tag]
-        else:
-            return None
+        # None if not found
+        return self.m_params_dict.get(par_tag)
 
     # -------------------------
 
@@ -246,15 +326,15 @@ class qSim_qcln_qasm():
 
     @staticmethod
     def is_ftype_q1(ftype):
-        return ftype in range(QASM_F_TYPE_I, QASM_F_TYPE_Rz+1)
+        return QASM_F_TYPE_I <= ftype <= QASM_F_TYPE_Rz
 
     @staticmethod
     def is_ftype_q2(ftype):
-        return ftype in range(QASM_F_TYPE_CU, QASM_F_TYPE_CZ+1)
+        return QASM_F_TYPE_CU <= ftype <= QASM_F_TYPE_CZ
 
     @staticmethod
     def is_ftype_qn(ftype):
-        return ftype in range(QASM_F_TYPE_MCS_LRU, QASM_F_TYPE_MCS_LRU)
+        return QASM_F_TYPE_MCS_LRU <= ftype <= QASM_F_TYPE_CCX
     
     @staticmethod
     def is_ftype_block(ftype):
@@ -280,56 +360,49 @@ class qSim_qcln_qasm():
 
     def from_raw_message(self, msg_str):
         # extract counter, id and params from given string
-
-        idx = msg_str.find(QASM_MSG_FIELD_SEP) # first separator mandatory
-        if idx < 1:
+        # -> fields and params split in one go, no progressive slicing
+        try:
+            counter, mid, params = msg_str.split(QASM_MSG_FIELD_SEP, 2) # both separators mandatory
+            self.m_counter = int(counter)
+            self.m_id = int(mid)
+            self.m_params_dict = dict([par_pair.split(QASM_MSG_PARVAL_SEP, 1) 
+                                       for par_pair in params.split(QASM_MSG_PARAM_SEP) if par_pair])
+        except ValueError:
             print('qSim_qasm_message::from_raw_message - wrong format!')
-            return
-	
-        self.m_counter = int(msg_str[0:idx])
-        msg_str = msg_str[idx+1:]
-        # print('m_counter:', self.m_counter, '...msg_str:', msg_str)
-
-        idx = msg_str.find(QASM_MSG_FIELD_SEP) # second separator mandatory
-        if idx < 1:
-            print('qSim_qasm_message::from_raw_message - wrong format!')
-            return
-	
-        self.m_id = int(msg_str[0:idx])
-        msg_str = msg_str[idx+1:]
-        # print('m_id:', self.m_id, '...msg_str:', msg_str)
 
-        self.m_params_dict.clear()
-        while len(msg_str) > 0:
-            idx = msg_str.find(QASM_MSG_PARAM_SEP) # separator mandatory
-            if idx < 1:
-                print('qSim_qasm_message::from_raw_message - wrong format!')
-                return
+    def to_raw_message(self):
+        # encode counter, id and params into a string
+        # -> single join over params, no accumulation
+        return self.encode_raw_message(self.m_counter, self.m_id, self.m_params_dict.items())
 
-            par_pair = msg_str[0:idx]
-            msg_str = msg_str[idx+1:]
+    @staticmethod
+    def encode_param(p_tag, p_val):
+        # encode a single (tag, value) pair - e.g. for building a params prefix
+        return QASM_MSG_PARAM_TAG_PREFIX[p_tag] + p_val + QASM_MSG_PARAM_SEP
+
+    @staticmethod
+    def encode_params(params, prefix=''):
+        # encode given pre-encoded params prefix and (tag, value) pairs into a string
+        return prefix + ''.join([QASM_MSG_PARAM_TAG_PREFIX[p_tag] + p_val + QASM_MSG_PARAM_SEP for p_tag, p_val in params])
 
-            idx2 = par_pair.find(QASM_MSG_PARVAL_SEP) # separator mandatory
-            if idx2 < 1:
-                print('qSim_qasm_message::from_raw_message - wrong format!')
-                return
+    @staticmethod
+    def encode_raw_message(counter, mid, params, prefix=''):
+        # encode counter, id, given pre-encoded params prefix and (tag, value) pairs into a string
+        # -> used by to_raw_message, also callable without building a message object
+        return (str(counter) + QASM_MSG_FIELD_SEP + str(mid) + QASM_MSG_FIELD_SEP + prefix +
+                ''.join([QASM_MSG_PARAM_TAG_PREFIX[p_tag] + p_val + QASM_MSG_PARAM_SEP for p_tag, p_val in params]))
+
+    # batched operations coding format: ASCII string with ";" as operation separators
+    #    <ops> = <op_1>;<op_2>; ... <op_n>
+    #
+    # with "&" as param tag + value pairs separator
+    #    <op> = <param_tag>=<param_value>&....
 
-            par_tag = par_pair[0:idx2]
-            par_val = par_pair[idx2+1:]
-            self.m_params_dict[par_tag] = par_val
+    @staticmethod
+    def encode_op(params):
+        # encode given (tag, value) pairs as a single batched operation
+        return QASM_MSG_OPS_PARAM_SEP.join([QASM_MSG_PARAM_TAG_PREFIX[p_tag] + p_val for p_tag, p_val in params])
 
-    def to_raw_message(self):
-        # encode counter, id and params into a string
-        msg_str = str(self.m_counter)
-        msg_str += QASM_MSG_FIELD_SEP
-        msg_str += str(self.m_id)
-        msg_str += QASM_MSG_FIELD_SEP
-        for p_key in self.m_params_dict.keys():
-            msg_str += p_key + QASM_MSG_PARVAL_SEP + self.m_params_dict[p_key]
-            msg_str += QASM_MSG_PARAM_SEP
-                
-        return msg_str
-    
     # -------------------------
     # diagnostics mehods
     
@@ -340,9 +413,9 @@ class qSim_qcln_qasm():
 
         print('m_counter:', self.m_counter)
         print('m_id:     ', self.m_id)
-        print('m_params_dict count:', len(self.m_params_dict.keys()))
-        for i, p_key in enumerate(self.m_params_dict.keys()):
-            print('#', i, 'par_tag:', p_key, 'par_val:', self.m_params_dict[p_key]);
+        print('m_params_dict count:', len(self.m_params_dict))
+        for i, (p_key, p_val) in enumerate(self.m_params_dict.items()):
+            print('#', i, 'par_tag:', p_key, 'par_val:', p_val);
         print()
         print('**********************************')
         print()
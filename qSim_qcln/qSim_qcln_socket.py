@@ -39,6 +39,19 @@ Created on Sat May 28 17:46:04 2022
 * 1.1   Nov-2022  Moved to qSim v2 and renamed to qSim_qcln_socket.
 * 1.2   Mar-2023  Improved socket transfer performance setting TCP NODELAY 
 *                 flag (2x improvement on client side).
+* 1.3   Oct-2026  Added asyncio based raw message exchange, for pipelining 
+*                 requests without waiting on each response.
+*                 Added raw message sending from a preallocated frame buffer.
+*                 Added multiple raw messages sending in one go (sendmsg).
+*                 Used preallocated transmission and reception buffers, 
+*                 reused across messages.
+*                 Single verbose check per received message.
+*                 Added transmission shutdown for orderly disconnection.
+*                 Asynchronous reception into the preallocated buffer too.
+*                 Enlarged socket kernel send/receive buffers.
+*                 Big raw messages sent with scatter/gather, no copy.
+*                 Message length field coded with a precompiled struct.
+*                 Added raw message sending from header and body parts.
 * 
 * ------------------------------------------------------------------------
 *
@@ -46,6 +59,8 @@ Created on Sat May 28 17:46:04 2022
 
 
 import socket
+import struct
+import asyncio
 
 
 # --------------------------------------------------------
@@ -54,6 +69,19 @@ import socket
 QSIM_SERVER_IP_ADDR = '127.0.0.1'
 QSIM_SERVER_PORT    = 27020
 
+# max message length accepted by qSim server
+QSIM_MSG_MAX_LEN = 65536
+
+# raw message length field size and coding (4 bytes little-endian unsigned)
+QSIM_MSG_LEN_SIZE = 4
+QSIM_MSG_LEN_STRUCT = struct.Struct('<I')
+
+# max buffers per sendmsg call (IOV_MAX on Linux)
+QSIM_SENDMSG_MAX_BUFS = 1024
+
+# socket kernel send/receive buffers size (e.g. big qureg states)
+QSIM_SOCK_BUF_SIZE = 1 << 20
+
 # --------------------------------------------------------
 
 # ==> qSim socket client handling
@@ -63,6 +91,12 @@ class qSim_qcln_socket():
         # class constructor 
         self.m_sock_client = None
         self.m_verbose = verbose
+        
+        # transmission & reception buffers - length field + message body
+        self.m_tx_buf = bytearray(QSIM_MSG_LEN_SIZE + QSIM_MSG_MAX_LEN)
+        self.m_tx_view = memoryview(self.m_tx_buf)
+        self.m_rx_buf = bytearray(QSIM_MSG_LEN_SIZE + QSIM_MSG_MAX_LEN)
+        self.m_rx_view = memoryview(self.m_rx_buf)
     
     # ------------------
     
@@ -70,12 +104,19 @@ class qSim_qcln_socket():
         # setup socket and connect to qSim server
         self.m_sock_client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.m_sock_client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # set no-delay for best perfo!!
+        # -> buffers set before connection, for proper TCP window scaling
+        self.m_sock_client.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, QSIM_SOCK_BUF_SIZE)
+        self.m_sock_client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, QSIM_SOCK_BUF_SIZE)
 
         self.m_sock_client.connect((ipAddr, port))
         if self.m_verbose:
             print('qSim-socket-client - server connected @ iaAddr:', ipAddr, ' - port:', port)
             print()
 
+    def shutdown(self):
+        # signal end of transmission to server - receiving still possible
+        self.m_sock_client.shutdown(socket.SHUT_WR)
+
     def disconnect(self):
         # disconect from server
         self.m_sock_client.close()
@@ -94,39 +135,131 @@ class qSim_qcln_socket():
         # read a raw message from server
         
         # get message length
-        from_server = self.m_sock_client.recv(4)
-        msg_len = int.from_bytes(from_server, 'little')
-        if self.m_verbose:
-            print('server raw message - len:', msg_len)
-        # print('raw_message...len field size:', len(from_server), ' val:', msg_len)
-    
-        # get message body - in a loop!
-        msg_str = ''
-        while len(msg_str) < msg_len:
-            from_server = self.m_sock_client.recv(msg_len)
-            msg_str += from_server.decode()
+        self.receive_exact_into(self.m_rx_view, QSIM_MSG_LEN_SIZE)
+        msg_len = QSIM_MSG_LEN_STRUCT.unpack_from(self.m_rx_buf)[0]
+        
+        # get message body - reception buffer enlarged if needed (e.g. big qureg states)
+        self.reserve_rx_buffer(msg_len)
+        self.receive_exact_into(self.m_rx_view, msg_len)
+        msg_str = str(self.m_rx_view[:msg_len], 'utf-8')
         if self.m_verbose:
-            print('server raw message - data:', msg_str)
-        # print('raw_message...data field size:', len(from_server), ' val (first 100!):', msg_str[:100])
+            print('server raw message - len:', msg_len, '- data:', msg_str)
         
         return msg_str
+    
+    def reserve_rx_buffer(self, msg_len):
+        # enlarge reception buffer to hold given message length
+        if msg_len > len(self.m_rx_buf):
+            self.m_rx_view.release()
+            self.m_rx_buf = bytearray(msg_len)
+            self.m_rx_view = memoryview(self.m_rx_buf)
+    
+    def receive_exact_into(self, buf_view, n_bytes):
+        # read exactly n_bytes from server into given buffer view - in a loop!
+        n_read = 0
+        while n_read < n_bytes:
+            n = self.m_sock_client.recv_into(buf_view[n_read:n_bytes])
+            if n == 0:
+                raise ConnectionError('qSim-client - connection closed by server')
+            n_read += n
         
     def send_raw_message(self, msg_str):
         # send a raw message from server
-        
-        # send message length
-        msg_len = len(msg_str)
-        self.m_sock_client.send(msg_len.to_bytes(4, byteorder='little'))
-        
-        # send message body
-        tot_sent = 0
-        while (tot_sent < msg_len):
-            tot_sent += self.m_sock_client.send(msg_str.encode())
-        # print('raw_message...data field size:', msg_len, ' tot_sent:', tot_sent)
-        
+        msg_bytes = msg_str.encode()
+        msg_len = len(msg_bytes)
+        if QSIM_MSG_LEN_SIZE + msg_len <= len(self.m_tx_buf):
+            # copied in the transmission buffer, after the length field
+            self.m_tx_view[QSIM_MSG_LEN_SIZE:QSIM_MSG_LEN_SIZE + msg_len] = msg_bytes
+            self.send_raw_frame(msg_len)
+        else:
+            # too big for the transmission buffer - length and body sent as 
+            # separate buffers in one go, no concatenation copy
+            self.send_raw_messages([msg_bytes])
+    
+    def send_raw_message_parts(self, msg_hdr, msg_body):
+        # send a raw message given as header and body bytes (e.g. counter and id fields 
+        # and pre-encoded params) - joined in the transmission buffer, after the length 
+        # field, returning the message length
+        msg_len = len(msg_hdr) + len(msg_body)
+        if QSIM_MSG_LEN_SIZE + msg_len <= len(self.m_tx_buf):
+            hdr_end = QSIM_MSG_LEN_SIZE + len(msg_hdr)
+            self.m_tx_view[QSIM_MSG_LEN_SIZE:hdr_end] = msg_hdr
+            self.m_tx_view[hdr_end:QSIM_MSG_LEN_SIZE + msg_len] = msg_body
+            self.send_raw_frame(msg_len)
+        else:
+            # too big for the transmission buffer - sent as a single message
+            self.send_raw_messages([msg_hdr + msg_body])
+        return msg_len
+    
+    def send_raw_frame(self, msg_len):
+        # send a raw message already encoded in the transmission buffer after 
+        # the length field - length set in place and whole frame sent in one go
+        QSIM_MSG_LEN_STRUCT.pack_into(self.m_tx_buf, 0, msg_len)
+        self.m_sock_client.sendall(self.m_tx_view[:QSIM_MSG_LEN_SIZE + msg_len])
         if self.m_verbose:
             print('qSim-client - message sent to server')
     
+    def send_raw_messages(self, msg_list):
+        # send given raw messages (as bytes) in one go - length and body of each 
+        # message passed as separate buffers to a single sendmsg (scatter/gather)
+        msg_bufs = []
+        for msg_bytes in msg_list:
+            msg_bufs.append(QSIM_MSG_LEN_STRUCT.pack(len(msg_bytes)))
+            msg_bufs.append(msg_bytes)
+        
+        for i in range(0, len(msg_bufs), QSIM_SENDMSG_MAX_BUFS):
+            bufs = msg_bufs[i:i + QSIM_SENDMSG_MAX_BUFS]
+            if hasattr(self.m_sock_client, 'sendmsg'):
+                tot_sent = self.m_sock_client.sendmsg(bufs)
+            else:
+                tot_sent = 0 # no sendmsg (e.g. Windows) - everything sent below
+            if tot_sent < sum(map(len, bufs)):
+                # partially sent - send the rest
+                self.m_sock_client.sendall(b''.join(bufs)[tot_sent:])
+        if self.m_verbose:
+            print('qSim-client -', len(msg_list), 'messages sent to server')
+    
+    # -------------------------
+    # asynchronous message reception and transmission - same handshake as above
+    # 
+    # Note: socket to be set in async mode (i.e. non-blocking) before use and
+    #       back to sync mode before using the blocking methods above
+    
+    def set_async_mode(self, async_mode):
+        self.m_sock_client.setblocking(not async_mode)
+    
+    async def receive_exact_async(self, buf_view, n_bytes):
+        # read exactly n_bytes from server into given buffer view - in a loop!
+        loop = asyncio.get_running_loop()
+        n_read = 0
+        while n_read < n_bytes:
+            n = await loop.sock_recv_into(self.m_sock_client, buf_view[n_read:n_bytes])
+            if n == 0:
+                raise ConnectionError('qSim-client - connection closed by server')
+            n_read += n
+    
+    async def receive_raw_message_async(self):
+        # read a raw message from server - same buffers as receive_raw_message 
+        # (single reader task)
+        await self.receive_exact_async(self.m_rx_view, QSIM_MSG_LEN_SIZE)
+        msg_len = QSIM_MSG_LEN_STRUCT.unpack_from(self.m_rx_buf)[0]
+        self.reserve_rx_buffer(msg_len)
+        await self.receive_exact_async(self.m_rx_view, msg_len)
+        msg_str = str(self.m_rx_view[:msg_len], 'utf-8')
+        if self.m_verbose:
+            print('server raw message - len:', msg_len, '- data:', msg_str)
+        return msg_str
+    
+    async def send_raw_messages_async(self, msg_list):
+        # send given raw messages (as bytes) in one go - no sendmsg support in 
+        # asyncio, so coalesced into a single buffer
+        loop = asyncio.get_running_loop()
+        frames = b''.join([QSIM_MSG_LEN_STRUCT.pack(len(msg_bytes)) + msg_bytes 
+                           for msg_bytes in msg_list])
+        await loop.sock_sendall(self.m_sock_client, frames)
+        if self.m_verbose:
+            print('qSim-client -', len(msg_list), 'messages sent to server')
+    
 
 # ******************************************************************
 # test functions
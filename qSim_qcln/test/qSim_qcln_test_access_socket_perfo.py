@@ -47,8 +47,12 @@ TST_MSG_IDS = [qasm.QASM_MSG_ID_QREG_ST_TRANSFORM,
                # qasm.QASM_MSG_ID_QREG_MEASURE,
                ]
 
-def test_qcln_access_client_socket_perfo(tot_msg=5, n=5, verbose=False):
+def test_qcln_access_client_socket_perfo(tot_msg=5, n=5, pipeline=1, window=1, verbose=False):
     # qSim client-server socket data exchange performance test
+    # -> pipeline > 1: transformations sent back-to-back in blocks of pipeline requests, 
+    #    then their responses read (message time & size averaged on the block)
+    # -> window > 1: transformations sent keeping up to window requests in flight
+    #    (message time & size averaged on the whole test)
     print('*** qSim Client-Server socket data exchange performance test ***')
     print()
     
@@ -63,30 +67,49 @@ def test_qcln_access_client_socket_perfo(tot_msg=5, n=5, verbose=False):
     print('=> qureg allocated - tot_qubits:', n)
     print()
     
-    msg_tm_vec = []
-    msg_sz_vec = []
+    # random messages selected in one go, stats vectors preallocated
+    msg_idx_vec = np.random.randint(0, len(TST_MSG_IDS), size=tot_msg)
+    msg_tm_vec = np.empty(tot_msg)
+    msg_sz_vec = np.empty(tot_msg)
     tot_trf = 0
     tot_msr = 0
     i_block = 10
-    for i in range(tot_msg):
-        if i % i_block == 0:
+    if window > 1:
+        # windowed transformations
+        msg_tm, msg_sz = apply_transformations_windowed(qcln, qr_h, tot_msg, window, verbose)
+        tot_trf += tot_msg
+        msg_tm_vec[:] = msg_tm/tot_msg
+        msg_sz_vec[:] = msg_sz/tot_msg/1024 # to KB
+    elif pipeline > 1:
+        # pipelined transformations
+        for i in range(0, tot_msg, pipeline):
             print('iteration #', i)
+            k = min(pipeline, tot_msg - i)
+            msg_tm, msg_sz = apply_transformations_pipelined(qcln, qr_h, k, verbose)
+            tot_trf += k
             
-        # select a random message 
-        idx = np.random.randint(0, len(TST_MSG_IDS))
-        msg_id = TST_MSG_IDS[idx]
-
-        # apply it & get response
-        if msg_id == qasm.QASM_MSG_ID_QREG_ST_TRANSFORM:
-            msg_tm, msg_sz = apply_transformation(qcln, qr_h, verbose)
-            tot_trf += 1
-        else: #elif msg_id == qasm.QASM_MSG_ID_QREG_MEASURE:
-            msg_tm, msg_sz = apply_measure(qcln, qr_h, n, verbose)
-            tot_msr += 1
-                    
-        # update elapsed time and exchanged data info
-        msg_tm_vec.append(msg_tm)    
-        msg_sz_vec.append(msg_sz/1024) # to KB
+            # update elapsed time and exchanged data info - per message
+            msg_tm_vec[i:i+k] = msg_tm/k
+            msg_sz_vec[i:i+k] = msg_sz/k/1024 # to KB
+    else:
+        for i in range(tot_msg):
+            if i % i_block == 0:
+                print('iteration #', i)
+                
+            # select a random message 
+            msg_id = TST_MSG_IDS[msg_idx_vec[i]]
+    
+            # apply it & get response
+            if msg_id == qasm.QASM_MSG_ID_QREG_ST_TRANSFORM:
+                msg_tm, msg_sz = apply_transformation(qcln, qr_h, verbose)
+                tot_trf += 1
+            else: #elif msg_id == qasm.QASM_MSG_ID_QREG_MEASURE:
+                msg_tm, msg_sz = apply_measure(qcln, qr_h, n, verbose)
+                tot_msr += 1
+                        
+            # update elapsed time and exchanged data info
+            msg_tm_vec[i] = msg_tm
+            msg_sz_vec[i] = msg_sz/1024 # to KB
 
     # release qureg and disconnect
     qcln.qreg_release(qr_h)    
@@ -97,16 +120,18 @@ def test_qcln_access_client_socket_perfo(tot_msg=5, n=5, verbose=False):
     print()
 
     # calculate other stats
-    msg_tm_vec = np.array(msg_tm_vec)
-    msg_sz_vec = np.array(msg_sz_vec)
+    # -> averages computed once, single reduction each
+    # -> msg/sec as overall throughput (total messages over total time)
     kb_sec_rate_vec = msg_sz_vec/msg_tm_vec
-    msg_sec_rate_avg = np.mean(1./msg_tm_vec)
-    kb_sec_rate_avg = np.mean(kb_sec_rate_vec)
+    msg_tm_avg = msg_tm_vec.mean()
+    msg_sz_avg = msg_sz_vec.mean()
+    msg_sec_rate_avg = 1./msg_tm_avg
+    kb_sec_rate_avg = kb_sec_rate_vec.mean()
     
     # plot results
     plt.figure()
     plt.plot(msg_tm_vec, label='msg-time')
-    plt.plot([np.mean(msg_tm_vec)]*tot_msg, 'r', label='msg-time-avg')
+    plt.plot([msg_tm_avg]*tot_msg, 'r', label='msg-time-avg')
     plt.legend()
     plt.grid()
     plt.xlabel('loop #')
@@ -117,7 +142,7 @@ def test_qcln_access_client_socket_perfo(tot_msg=5, n=5, verbose=False):
 
     plt.figure()
     plt.plot(msg_sz_vec, label='msg-size')
-    plt.plot([np.mean(msg_sz_vec)]*tot_msg, 'r', label='msg-size-avg')
+    plt.plot([msg_sz_avg]*tot_msg, 'r', label='msg-size-avg')
     plt.legend()
     plt.grid()
     plt.xlabel('loop #')
@@ -128,7 +153,7 @@ def test_qcln_access_client_socket_perfo(tot_msg=5, n=5, verbose=False):
         
     plt.figure()
     plt.plot(kb_sec_rate_vec, label='trf-rate')
-    plt.plot([np.mean(kb_sec_rate_vec)]*tot_msg, 'r', label='trf-rate-avg')
+    plt.plot([kb_sec_rate_avg]*tot_msg, 'r', label='trf-rate-avg')
     plt.legend()
     plt.grid()
     plt.xlabel('loop #')
@@ -151,8 +176,9 @@ def test_qcln_access_client_socket_perfo(tot_msg=5, n=5, verbose=False):
     
 # ------------------------------------------------------    
 
-def apply_transformation(qcln, qr_h, verbose=False):
-    # set qureg transformation params
+def transformation_params():
+    # random qureg transformation params 
+    # -> as (f_type, f_size, f_rep, f_lsq, f_crng, f_trng, f_args, fu_type, fu_size)
     f_type = np.random.randint(0, qasm.QASM_F_TYPE_CZ+1)
     f_rep = 1
     f_lsq = 0
@@ -171,14 +197,19 @@ def apply_transformation(qcln, qr_h, verbose=False):
             # define controlled 1-qubit function
             fu_type = qasm.QASM_F_TYPE_H
             fu_size = 2
+    return f_type, f_size, f_rep, f_lsq, [], [], f_args, fu_type, fu_size
+
+def apply_transformation(qcln, qr_h, verbose=False):
+    # set qureg transformation params
+    f_type, f_size, f_rep, f_lsq, _, _, f_args, fu_type, fu_size = transformation_params()
 
     # apply and get result and stats        
-    start_tm = time.time()
+    start_tm = time.perf_counter_ns()
     res, diag = qcln.qreg_state_transform(qr_h, f_type, f_size, f_rep, f_lsq, 
                                     f_args=f_args, fu_type=fu_type, fu_size=fu_size, 
                                     diag=True)
-    end_tm = time.time() # take timing...
-    msg_tm = end_tm - start_tm
+    end_tm = time.perf_counter_ns() # take timing (monotonic, ns resolution)...
+    msg_tm = (end_tm - start_tm)*1e-9
     msg_sz = diag[0] + diag[1] # cumulate request and response message sizes
     if verbose:
         print('=> qr-transformation [', f_type, '] ... res:', res, 'tm:', msg_tm, 'sz:', msg_sz)
@@ -187,6 +218,40 @@ def apply_transformation(qcln, qr_h, verbose=False):
 
 # ---------------------
 
+def apply_transformations_pipelined(qcln, qr_h, k, verbose=False):
+    # set k qureg transformations params
+    gate_list = [transformation_params() for _ in range(k)]
+
+    # apply and get result and stats - for the whole block
+    start_tm = time.perf_counter_ns()
+    res, diag = qcln.qreg_state_transform_pipelined(qr_h, gate_list, diag=True)
+    end_tm = time.perf_counter_ns() # take timing (monotonic, ns resolution)...
+    msg_tm = (end_tm - start_tm)*1e-9
+    msg_sz = diag[0] + diag[1] # cumulate request and response message sizes
+    if verbose:
+        print('=> qr-transformations pipelined [', k, '] ... res:', res, 'tm:', msg_tm, 'sz:', msg_sz)
+        print()            
+    return msg_tm, msg_sz
+
+# ---------------------
+
+def apply_transformations_windowed(qcln, qr_h, k, window, verbose=False):
+    # set k qureg transformations params
+    gate_list = [transformation_params() for _ in range(k)]
+
+    # apply and get result and stats - for all transformations
+    start_tm = time.perf_counter_ns()
+    res, diag = qcln.qreg_state_transform_windowed(qr_h, gate_list, window, diag=True)
+    end_tm = time.perf_counter_ns() # take timing (monotonic, ns resolution)...
+    msg_tm = (end_tm - start_tm)*1e-9
+    msg_sz = diag[0] + diag[1] # cumulate request and response message sizes
+    if verbose:
+        print('=> qr-transformations windowed [', k, '/', window, '] ... res:', res, 'tm:', msg_tm, 'sz:', msg_sz)
+        print()            
+    return msg_tm, msg_sz
+
+# ---------------------
+
 def apply_measure(qcln, qr_h, n, verbose=False):
     # set qureg measurement params
     q_idx = 0
@@ -195,10 +260,10 @@ def apply_measure(qcln, qr_h, n, verbose=False):
     st_coll = False
 
     # apply and get result and stats        
-    start_tm = time.time()
+    start_tm = time.perf_counter_ns()
     m_st, _, _, diag = qcln.qreg_measure(qr_h, q_idx, q_len, m_rand, st_coll, diag=True)
-    end_tm = time.time() # take timing...
-    msg_tm = end_tm - start_tm
+    end_tm = time.perf_counter_ns() # take timing (monotonic, ns resolution)...
+    msg_tm = (end_tm - start_tm)*1e-9
     msg_sz = diag[0] + diag[1] # cumulate request and response message sizes
     if verbose:
         print('=> qr-measure... m_st:', m_st, 'tm:', msg_tm, 'sz:', msg_sz)
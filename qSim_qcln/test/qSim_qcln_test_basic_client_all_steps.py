@@ -29,98 +29,212 @@ Created on Thu May 26 15:01:27 2022
 """
 
 import socket
-import time
+import struct
+import asyncio
         
+# qSim server address (ip-address, port) - numeric, no name resolution
+SERVER_ADDR = ('127.0.0.1', 27020)
 
-def qSim_qcln_socket_client():
+# message length field - 4 bytes little-endian
+MSG_LEN_STRUCT = struct.Struct('<I')
+
+# socket send/receive buffers size - qSim server max message length (64KB)
+SOCK_BUF_SIZE = 1 << 16
+
+# request messages - registration, qreg (size 2) allocation and unregistration
+MSG_REGISTER = "0|1|id=myqpy-client:"
+MSG_QREG_ALLOCATE = "1|10|token={}:qr_n=2:".format
+MSG_UNREGISTER = "0|2|token={}:".format
+
+# receive flags - wait for the whole requested length where supported (blocking sockets only)
+RECV_FLAGS = getattr(socket, 'MSG_WAITALL', 0)
+
+
+def recv_exact(sock, n):
+    # read exactly n bytes from given socket - into a preallocated buffer
+    # -> a single read with MSG_WAITALL, loop kept for short reads (e.g. signals, no flag support)
+    buf = bytearray(n)
+    view = memoryview(buf)
+    n_read = 0
+    while n_read < n:
+        k = sock.recv_into(view[n_read:], n - n_read, RECV_FLAGS)
+        if k == 0:
+            raise EOFError('qSim server closed the connection')
+        n_read += k
+    set_quickack(sock)
+    return buf
+
+def set_quickack(sock):
+    # ack received data immediately (linux only) - not persistent, so re-applied after each read
+    if hasattr(socket, 'TCP_QUICKACK'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+def check_nodelay(sock):
+    # check Nagle algorithm disabled on given socket
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0, 'TCP_NODELAY not set!'
+
+def frame_message(msg):
+    # encode given message (ASCII protocol) and prefix its length
+    msg_bytes = msg.encode('ascii')
+    return MSG_LEN_STRUCT.pack(len(msg_bytes)) + msg_bytes
+
+def connect_client():
+    # connect to qSim server, with no-delay set
+    # -> no-delay and send/receive buffers sized to the max message set before connecting 
+    #    (no auto-tuning ramp)
+    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCK_BUF_SIZE)
+    client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCK_BUF_SIZE)
+    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # set no-delay for best perfo!!
+    client.settimeout(5) # connection timeout only
+    client.connect(SERVER_ADDR)
+    client.settimeout(None) # back to blocking - MSG_WAITALL ignored on timeout sockets
+    return client
+
+def qSim_qcln_socket_client(verbose=True, client=None):
+    # register, allocate a qureg and unregister, with raw protocol messages
+    # -> requests and responses printed only if verbose
+    # -> given connected client socket used and left open (e.g. reused across runs), 
+    #    otherwise connected and closed here
     print('*** qSim test client ***')
     print()
     
-    ipAddr = '127.0.0.1'
-    port = 27020
-    print('qSim server info - ipAddr:',ipAddr, 'port:', port)
+    print('qSim server info - ipAddr:', SERVER_ADDR[0], 'port:', SERVER_ADDR[1])
     print()
 
     # connecting    
-    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    client.connect((ipAddr, port))
-    print('qSim server connected...')    
-    print()
+    own_client = client is None
+    if own_client:
+        client = connect_client()
+        print('qSim server connected...')    
+        print()
+    check_nodelay(client)
 
-    time.sleep(1)
-    
     # sending a registration request
-    msg = "0|1|name=myqpy-client:"
-    msg_len = len(msg)
-    client.send(msg_len.to_bytes(4, byteorder='little'))
-    client.send(msg.encode())
-    print('client request - len: ', msg_len, 'msg:', msg)
-    print()
-    print(' ...waiting for the response')
+    msg = MSG_REGISTER
+    msg_frame = frame_message(msg)
+    client.sendall(msg_frame) # length and body in one go
+    if verbose:
+        print('client request - len: ', len(msg_frame) - MSG_LEN_STRUCT.size, 'msg:', msg)
+        print()
+        print(' ...waiting for the response')
     
     # reading the answer and extract token
-    from_server = client.recv(4)
-    rsp_len = int.from_bytes(from_server, 'little')  
-    print('server response - len:', rsp_len)
-
-    from_server = client.recv(rsp_len)
-    rsp_msg = from_server.decode()
-    print('server response - msg:', rsp_msg)
-    print()
+    from_server = recv_exact(client, MSG_LEN_STRUCT.size)
+    rsp_len = MSG_LEN_STRUCT.unpack(from_server)[0]
+    from_server = recv_exact(client, rsp_len)
+    if verbose:
+        print('server response - len:', rsp_len)
+        print('server response - msg:', from_server.decode('ascii'))
+        print()
     
-    idx = rsp_msg.find('token=')
-    token = rsp_msg[idx+6:-1]
+    token = from_server.partition(b'token=')[2].partition(b':')[0].decode('ascii') # up to param separator, only token decoded
     print('=> token:', token)
     print()
     
-    time.sleep(1)
-        
     # sending a request
     # -> allocate qreg size 2
-    msg = "1|10|token=" + token + ":qn=2:"
-    msg_len = len(msg)
-    client.send(msg_len.to_bytes(4, byteorder='little'))
-    client.send(msg.encode())
-    print('client request - len: ', msg_len, 'msg:', msg)
-    print()
-    print(' ...waiting for the response')
+    msg = MSG_QREG_ALLOCATE(token)
+    msg_frame = frame_message(msg)
+    client.sendall(msg_frame) # length and body in one go
+    if verbose:
+        print('client request - len: ', len(msg_frame) - MSG_LEN_STRUCT.size, 'msg:', msg)
+        print()
+        print(' ...waiting for the response')
     
     # reading the answer
-    from_server = client.recv(4)
-    rsp_len = int.from_bytes(from_server, 'little')  
-    print('server response - len:', rsp_len)
+    from_server = recv_exact(client, MSG_LEN_STRUCT.size)
+    rsp_len = MSG_LEN_STRUCT.unpack(from_server)[0]
+    from_server = recv_exact(client, rsp_len)
+    if verbose:
+        print('server response - len:', rsp_len)
+        print('server response - msg:', from_server.decode('ascii'))
+        print()
 
-    from_server = client.recv(rsp_len)
-    rsp_msg = from_server.decode()
-    print('server response - msg:', rsp_msg)
-    print()
+    # sending an unregistration request
+    msg = MSG_UNREGISTER(token)
+    msg_frame = frame_message(msg)
+    client.sendall(msg_frame) # length and body in one go
+    if verbose:
+        print('client request - len: ', len(msg_frame) - MSG_LEN_STRUCT.size, 'msg:', msg)
+        print()
+
+    # reading the answer - before closing, for a clean disconnection (no server write 
+    # to a closed peer) and to keep the next run responses in sync on a reused client
+    from_server = recv_exact(client, MSG_LEN_STRUCT.size)
+    rsp_len = MSG_LEN_STRUCT.unpack(from_server)[0]
+    from_server = recv_exact(client, rsp_len)
+    if verbose:
+        print('server response - len:', rsp_len)
+        print('server response - msg:', from_server.decode('ascii'))
+        print()
+
+    # disconnecting
+    if own_client:
+        client.close()
+        print('client disconnected')
+        print()
     
-    time.sleep(1)
+    print('done.')
+    print()
 
-    # sending an unregistration request
-    msg = "0|2|token=" + token + ":"
-    msg_len = len(msg)
-    client.send(msg_len.to_bytes(4, byteorder='little'))
-    client.send(msg.encode())
-    print('client request - len: ', msg_len, 'msg:', msg)
+
+async def recv_message_async(reader):
+    # read a length-prefixed response message - exact reads done by the stream reader
+    rsp_len = MSG_LEN_STRUCT.unpack(await reader.readexactly(MSG_LEN_STRUCT.size))[0]
+    return rsp_len, await reader.readexactly(rsp_len)
+
+async def send_request_async(reader, writer, msg, verbose):
+    # send a request message and read its response (raw bytes)
+    writer.write(frame_message(msg))
+    await writer.drain()
+    if verbose:
+        print('client request - msg:', msg)
+        print()
+        print(' ...waiting for the response')
+
+    rsp_len, from_server = await recv_message_async(reader)
+    if verbose:
+        print('server response - len:', rsp_len)
+        print('server response - msg:', from_server.decode('ascii'))
+        print()
+    return from_server
+
+async def qSim_qcln_socket_client_async(verbose=True):
+    # asyncio version of qSim_qcln_socket_client, on its own connection
+    # -> requests still sent one at a time: the server may serve pipelined requests 
+    #    out of order (e.g. unregistration before allocation)
+    print('*** qSim test client (asyncio) ***')
+    print()
+    
+    print('qSim server info - ipAddr:', SERVER_ADDR[0], 'port:', SERVER_ADDR[1])
     print()
 
-    # reading the answer =>> OPTIONAL.....
-    from_server = client.recv(4)
-    rsp_len = int.from_bytes(from_server, 'little')  
-    print('server response - len:', rsp_len)
+    # connecting - no-delay set by asyncio on TCP streams
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(*SERVER_ADDR), timeout=5)
+    check_nodelay(writer.get_extra_info('socket'))
+    print('qSim server connected...')    
+    print()
 
-    from_server = client.recv(rsp_len)
-    rsp_msg = from_server.decode()
-    print('server response - msg:', rsp_msg)
+    # sending a registration request and extract token
+    from_server = await send_request_async(reader, writer, MSG_REGISTER, verbose)
+    token = from_server.partition(b'token=')[2].partition(b':')[0].decode('ascii') # up to param separator, only token decoded
+    print('=> token:', token)
     print()
 
+    # sending a request
+    # -> allocate qreg size 2
+    await send_request_async(reader, writer, MSG_QREG_ALLOCATE(token), verbose)
+
+    # sending an unregistration request
+    # -> answer read before closing, for a clean disconnection
+    await send_request_async(reader, writer, MSG_UNREGISTER(token), verbose)
+
     # disconnecting
-    client.close()
+    writer.close()
+    await writer.wait_closed()
     print('client disconnected')
     print()
     
     print('done.')
     print()
-    
-    
@@ -24,32 +24,143 @@ Created on Sat May 28 21:06:16 2022
 """
 *****  Quantum Circuit Class Testing  *****
 *
-* Test QASM message handling functions ---
+* Test QASM message handling functions and access client message coding
+* helpers ---
 *
 """
 
 
+import numpy as np
+
 import qSim_qcln_qasm as qasm
+import qSim_qcln_access_client as qacc
 
 
 # ******************************************************************
 # test functions
 # ******************************************************************
 
-def test_qcln_qasm():
+# test messages - raw string and expected (counter, id, params)
+QASM_TEST_MESSAGES = [
+    ('0|1|id=myqpy-client:', 0, 1, {'id': 'myqpy-client'}), # register
+    ('0|20|result=Ok:token=1653751880:', 0, 20, {'result': 'Ok', 'token': '1653751880'}), # register response
+    ('1|10|token=1653751880aaa:qr_n=2:', 1, 10, {'token': '1653751880aaa', 'qr_n': '2'}), # allocate qureg
+    ('1|20|qr_h=29:result=Ok:', 1, 20, {'qr_h': '29', 'result': 'Ok'}), # allocate qureg response
+    ('0|2|token=1653751880:', 0, 2, {'token': '1653751880'}), # unregister
+    ]
+
+def test_qcln_qasm(verbose=False):
+    # decode each test message, check its fields and round-trip encoding
+    # -> message dumps and strings printed only if verbose
     qm = qasm.qSim_qcln_qasm()
-    msg_str = '1|10|token=1653751880aaa:qr_n=2:' # allocate qureg
-    print('=>> msg_str:', msg_str)
-    print()
+    for msg_str, counter, mid, params in QASM_TEST_MESSAGES:
+        qm.from_raw_message(msg_str)
+        assert (qm.m_counter, qm.m_id, qm.m_params_dict) == (counter, mid, params), msg_str
 
-    qm.from_raw_message(msg_str)    
-    qm.dump()
-    
-    msg_str2 = qm.to_raw_message()
-    print('=>> msg_str2:', msg_str2)
-    print()
+        msg_str2 = qm.to_raw_message()
+        assert msg_str2 == msg_str, msg_str2
+        if verbose:
+            print('=>> msg_str:', msg_str)
+            print()
+            qm.dump()
+            print('=>> msg_str2:', msg_str2)
+            print()
     
     print('done.')
     
 # -------------------------
 
+# function type checks - function type and expected (q1, q2, qn, block, block-qml)
+# checks result, at each range boundary
+QASM_TEST_FTYPES = [
+    (qasm.QASM_F_TYPE_NULL,      (False, False, False, False, False)),
+    (qasm.QASM_F_TYPE_I,         (True,  False, False, False, False)),
+    (qasm.QASM_F_TYPE_Rz,        (True,  False, False, False, False)),
+    (qasm.QASM_F_TYPE_CU,        (False, True,  False, False, False)),
+    (qasm.QASM_F_TYPE_CZ,        (False, True,  False, False, False)),
+    (qasm.QASM_F_TYPE_MCS_LRU,   (False, False, True,  False, False)),
+    (qasm.QASM_F_TYPE_CCX,       (False, False, True,  False, False)),
+    (qasm.QASM_F_TYPE_CCX + 1,   (False, False, False, False, False)),
+    (qasm.QASM_FB_TYPE_SWAP_Q1 - 1, (False, False, False, False, False)),
+    (qasm.QASM_FB_TYPE_SWAP_Q1,  (False, False, False, True,  False)),
+    (qasm.QASM_FB_TYPE_CSWAP_Qn, (False, False, False, True,  False)),
+    (qasm.QASM_FB_TYPE_CSWAP_Qn + 1, (False, False, False, False, False)),
+    (qasm.QASM_FBQML_TYPE_FMAP - 1, (False, False, False, False, False)),
+    (qasm.QASM_FBQML_TYPE_FMAP,  (False, False, False, False, True)),
+    (qasm.QASM_FBQML_TYPE_QNET,  (False, False, False, False, True)),
+    (qasm.QASM_FBQML_TYPE_QNET + 1, (False, False, False, False, False)),
+    ]
+
+def test_qcln_qasm_ftypes(verbose=False):
+    # check function type ranges - same as QASM_F_IS_xx / QASM_FB_IS_xx macros
+    qm = qasm.qSim_qcln_qasm
+    for ftype, checks in QASM_TEST_FTYPES:
+        res = (qm.is_ftype_q1(ftype), qm.is_ftype_q2(ftype), qm.is_ftype_qn(ftype), 
+               qm.is_ftype_block(ftype), qm.is_ftype_block_qml(ftype))
+        assert res == checks, (ftype, res)
+        assert res[:3] == (qasm.QASM_F_IS_Q1(ftype), qasm.QASM_F_IS_Q2(ftype), qasm.QASM_F_IS_Qn(ftype)), ftype
+        if verbose:
+            print('=>> ftype:', ftype, 'checks:', res)
+    
+    print('done.')
+
+# function arguments - function type, function-U type, arguments and expected string
+QASM_TEST_FARGS = [
+    (qasm.QASM_F_TYPE_H, qasm.QASM_F_TYPE_NULL, None, '[]'),
+    (qasm.QASM_F_TYPE_H, qasm.QASM_F_TYPE_NULL, [], '[]'),
+    (qasm.QASM_F_TYPE_Rx, qasm.QASM_F_TYPE_NULL, [0.3], '[0.3|D]'),
+    (qasm.QASM_F_TYPE_Rx, qasm.QASM_F_TYPE_NULL, np.array([0.25]), '[0.25|D]'),
+    (qasm.QASM_F_TYPE_CU, qasm.QASM_F_TYPE_PS, [0.2], '[0.2|D]'),
+    (qasm.QASM_F_TYPE_CX, qasm.QASM_F_TYPE_NULL, [1], '[]'),
+    (qasm.QASM_F_TYPE_MCS_LRU, qasm.QASM_F_TYPE_X, [0.5], '[0.5|D]'),
+    (qasm.QASM_F_TYPE_MCS_LRU, qasm.QASM_F_TYPE_CX, [(0, 1), (2, 3), 0.1], '[(0, 1)|R,(2, 3)|R,0.1|D]'),
+    (qasm.QASM_F_TYPE_MCS_LRU, qasm.QASM_F_TYPE_CX, [np.array([0, 1]), (2,)], '[(0, 1)|R,(2)|R]'),
+    (qasm.QASM_FBQML_TYPE_FMAP, qasm.QASM_F_TYPE_NULL, [0.1, 0.2], '[0.1|D,0.2|D]'),
+    (qasm.QASM_FB_TYPE_SWAP_Q1, qasm.QASM_F_TYPE_NULL, [1], '[]'),
+    ]
+
+# index ranges - range and expected string
+QASM_TEST_RANGES = [
+    (None, qacc.QSIM_EMPTY_RANGE),
+    ([], qacc.QSIM_EMPTY_RANGE),
+    (np.array([], dtype=int), qacc.QSIM_EMPTY_RANGE),
+    ([0, 2], '(0, 2)'),
+    (np.array([1, 3]), '(1, 3)'),
+    ((4,), '(4)'),
+    (np.array([5]), '(5)'),
+    ]
+
+def test_qcln_access_client_coding(verbose=False):
+    # check access client message coding helpers - no server connection needed
+    qcln = qacc.qSim_qcln_access_client()
+    
+    # state values as string and as binary string - round trip
+    qr_st = np.array([0.5 + 0.5j, -0.25 + 0j, 0.125 - 0.75j, 1e-9 + 0j])
+    qr_st_str = qcln.states_complex_2_string(qr_st)
+    assert np.allclose(qcln.states_string_2_complex(qr_st_str), qr_st), qr_st_str
+    srv_st_str = '(0.5, 0.5), (-0.25, 0.0), (0.125, -0.75), (1e-09, 0.0) ' # server format
+    assert np.array_equal(qcln.states_string_2_complex(srv_st_str), qr_st), srv_st_str
+    assert len(qcln.states_string_2_complex('')) == 0
+    qr_st_bin = qcln.states_complex_2_binary_string(qr_st)
+    assert np.array_equal(qcln.states_binary_string_2_complex(qr_st_bin), qr_st), qr_st_bin
+    if verbose:
+        print('=>> qr_st_str:', qr_st_str)
+        print('=>> qr_st_bin:', qr_st_bin)
+    
+    # measured state indexes as binary string
+    idxs = [0, 3, 5, 1 << 20]
+    idxs_bin = qacc.base64.b64encode(np.array(idxs, dtype='<u4').tobytes()).decode()
+    assert qcln.indexes_binary_string_2_list(idxs_bin) == idxs, idxs_bin
+    
+    # index ranges and function arguments
+    for rng_val, rng_str in QASM_TEST_RANGES:
+        assert qcln.index_range_to_string(rng_val) == rng_str, (rng_val, qcln.index_range_to_string(rng_val))
+    for ftype, futype, fargs, fargs_str in QASM_TEST_FARGS:
+        fargs_str2 = qcln.fargs_to_string(fargs, ftype, futype)
+        assert fargs_str2 == fargs_str, (ftype, futype, fargs, fargs_str2)
+        if verbose:
+            print('=>> ftype:', ftype, 'futype:', futype, 'fargs_str:', fargs_str2)
+    
+    print('done.')
+    
+# -------------------------
@@ -44,6 +44,9 @@
  *  2.2   Feb-2023   Supported qureg state expectation calculation and fixed
  *                   terminology for state probability measure.
  *                   Handled QML function blocks (feature map and q-net).
+ *  2.3   Oct-2026   Supported batched qureg state transformations.
+ *                   Returned binary (base64) qureg state values and measured
+ *                   state indexes on request.
  *
  *  --------------------------------------------------------------------------
  */
@@ -123,6 +126,10 @@ bool qSim_qcpu::switchOff() {
 qSim_qasm_message* qSim_qcpu::dispatch_instruction(qSim_qasm_message* msg_in) {
 	// handle instruction execution based on instruction type and return response
 
+	// batched transformations handled separately
+	if (msg_in->is_batch_message())
+		return dispatch_instruction_batch(msg_in);
+
 	// allocate a qureg instruction object and process it
 	QASM_MSG_PARAMS_TYPE params;
 	if (qSim_qinstruction_base::is_core(msg_in)) {
@@ -173,6 +180,57 @@ qSim_qasm_message* qSim_qcpu::dispatch_instruction(qSim_qasm_message* msg_in) {
 	return msg_out;
 }
 
+// batched transformations dispatching entry point
+qSim_qasm_message* qSim_qcpu::dispatch_instruction_batch(qSim_qasm_message* msg_in) {
+	// handle batched transformations execution, one operation after the other,
+	// and return a single response
+	// => execution stops at first failed operation (previous ones stay applied)
+
+	QASM_MSG_PARAMS_TYPE params;
+	QASM_MSG_OPS_TYPE ops;
+	if (!msg_in->get_param_ops(&ops)) {
+		// error case
+		cerr << "qSim_qcpu::dispatch_instruction_batch - wrong batched operations format!!" << endl;
+		params.insert(std::make_pair(QASM_MSG_PARAM_TAG_RESULT, QASM_MSG_PARAM_VAL_NOK));
+		params.insert(std::make_pair(QASM_MSG_PARAM_TAG_ERROR, "Wrong batched operations format"));
+	}
+	else {
+		// qureg handler shared by all operations
+		std::string qr_h_str = msg_in->get_param_valueByTag(QASM_MSG_PARAM_TAG_QREG_H);
+		params.insert(std::make_pair(QASM_MSG_PARAM_TAG_RESULT, QASM_MSG_PARAM_VAL_OK));
+		for (unsigned int i=0; i<ops.size(); i++) {
+			// build and execute the single transformation message
+			ops[i].insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_H, qr_h_str));
+			qSim_qasm_message op_msg(msg_in->get_counter(), QASM_MSG_ID_QREG_ST_TRANSFORM, ops[i]);
+			std::string op_err;
+			if (op_msg.check_syntax()) {
+				qSim_qasm_message* op_res = dispatch_instruction(&op_msg);
+				if (op_res->get_param_valueByTag(QASM_MSG_PARAM_TAG_RESULT) != QASM_MSG_PARAM_VAL_OK)
+					op_err = op_res->get_param_valueByTag(QASM_MSG_PARAM_TAG_ERROR);
+				delete op_res;
+			}
+			else
+				op_err = "message syntax wrong";
+
+			if (op_err.size() > 0) {
+				// operation failed - stop here
+				params[QASM_MSG_PARAM_TAG_RESULT] = QASM_MSG_PARAM_VAL_NOK;
+				params.insert(std::make_pair(QASM_MSG_PARAM_TAG_ERROR, "operation #" + to_string(i) + " - " + op_err));
+				break;
+			}
+		}
+	}
+
+	std::string res_val = params[QASM_MSG_PARAM_TAG_RESULT];
+	cout << "qCpu batch message [" << msg_in->get_id() << "] executed - ops: " << ops.size() << " - result: " << res_val << endl;
+
+	// build output message
+	int counter = msg_in->get_counter();
+	int id = QASM_MSG_ID_RESPONSE;
+	qSim_qasm_message* msg_out = new qSim_qasm_message(counter, id, params);
+	return msg_out;
+}
+
 // *********************************************************
 // *********************************************************
 
@@ -310,8 +368,14 @@ bool qSim_qcpu::exec_qureg_instruction_core(qSim_qinstruction_core* qr_instr,
 				params->insert(std::make_pair(QASM_MSG_PARAM_TAG_RESULT, QASM_MSG_PARAM_VAL_OK));
 				params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_MSTIDX, to_string(m_st)));
 				params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_MSTPR, qr_instr->double_value_to_string(m_pr)));
-				std::string m_vec_str = qr_instr->measure_index_value_to_string(m_vec);
-				params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_MSTIDXS, m_vec_str));
+				if (qr_instr->m_st_bin) {
+					std::string m_vec_str = qr_instr->measure_index_value_to_binary_string(m_vec);
+					params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_MSTIDXS_BIN, m_vec_str));
+				}
+				else {
+					std::string m_vec_str = qr_instr->measure_index_value_to_string(m_vec);
+					params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_MSTIDXS, m_vec_str));
+				}
 			}
 			else {
 				// measure error
@@ -375,9 +439,15 @@ bool qSim_qcpu::exec_qureg_instruction_core(qSim_qinstruction_core* qr_instr,
 
 			// store result
 			if (res) {
-				std::string qr_st_str = qr_instr->state_value_to_string(q_st);
 				params->insert(std::make_pair(QASM_MSG_PARAM_TAG_RESULT, QASM_MSG_PARAM_VAL_OK));
-				params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_STVALS, qr_st_str));
+				if (qr_instr->m_st_bin) {
+					std::string qr_st_str = qr_instr->state_value_to_binary_string(q_st);
+					params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_STVALS_BIN, qr_st_str));
+				}
+				else {
+					std::string qr_st_str = qr_instr->state_value_to_string(q_st);
+					params->insert(std::make_pair(QASM_MSG_PARAM_TAG_QREG_STVALS, qr_st_str));
+				}
 			}
 			else {
 				params->insert(std::make_pair(QASM_MSG_PARAM_TAG_RESULT, QASM_MSG_PARAM_VAL_NOK));
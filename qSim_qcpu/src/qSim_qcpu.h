@@ -41,6 +41,7 @@
  *                   to qSim_qcpu_device.
  *                   Code clean-up.
  *  2.2   Feb-2023   Handled QML function blocks (feature map and q-net).
+ *  2.3   Oct-2026   Supported batched qureg state transformations.
  *
  *  --------------------------------------------------------------------------
  */
@@ -73,6 +74,7 @@ class qSim_qcpu {
 
 		// QASM instruction message dispatcher
 		qSim_qasm_message* dispatch_instruction(qSim_qasm_message* msg_in);
+		qSim_qasm_message* dispatch_instruction_batch(qSim_qasm_message* msg_in);
 
 		// ----------------------------------------
 		// qcpu instructions execution handlers
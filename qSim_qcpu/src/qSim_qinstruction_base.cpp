@@ -30,6 +30,8 @@
  *  1.0   Dec-2022   Module creation.
  *  1.1   Feb-2023   Handled QML function blocks (feature map and q-net).
  *                   Added double to string precise conversion helper method.
+ *  1.2   Oct-2026   Added binary (base64) state value and measure index conversion
+ *                   helpers.
  *
  *  --------------------------------------------------------------------------
  */
@@ -398,6 +400,73 @@ bool qSim_qinstruction_base::state_string_to_value(std::string qr_st_str, QREG_S
 
 // ---------------------------------
 
+// binary string <-> complex array back & forth conversions
+// => state array binary string format: base64 encoded complex128 (little-endian
+//    real/imag double pairs) array
+
+static const char BASE64_CHARS[] = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+
+static std::string binary_to_base64_string(const unsigned char* buf, size_t len) {
+	std::string b64_str;
+	b64_str.reserve(((len + 2) / 3) * 4);
+	for (size_t i=0; i<len; i+=3) {
+		unsigned int v = buf[i] << 16;
+		if (i+1 < len) v |= buf[i+1] << 8;
+		if (i+2 < len) v |= buf[i+2];
+		b64_str += BASE64_CHARS[(v >> 18) & 0x3F];
+		b64_str += BASE64_CHARS[(v >> 12) & 0x3F];
+		b64_str += (i+1 < len) ? BASE64_CHARS[(v >> 6) & 0x3F] : '=';
+		b64_str += (i+2 < len) ? BASE64_CHARS[v & 0x3F] : '=';
+	}
+	return b64_str;
+}
+
+std::string qSim_qinstruction_base::state_value_to_binary_string(QREG_ST_VAL_ARRAY_TYPE q_st) {
+	return binary_to_base64_string(reinterpret_cast<const unsigned char*>(q_st.data()),
+			                       q_st.size() * sizeof(QREG_ST_VAL_TYPE));
+}
+
+bool qSim_qinstruction_base::state_binary_string_to_value(std::string qr_st_str, QREG_ST_VAL_ARRAY_TYPE* qr_st) {
+	qr_st->clear();
+	std::string buf;
+	buf.reserve((qr_st_str.size() / 4) * 3);
+	unsigned int v = 0;
+	int n_bits = 0;
+	for (unsigned int i=0; i<qr_st_str.size(); i++) {
+		char c = qr_st_str[i];
+		if (c == '=')
+			break;
+		const char* pos = strchr(BASE64_CHARS, c);
+		if ((c == 0) || (pos == NULL)) {
+			cerr << "qregSt_binary_string_to_value error - wrong base64 character in [" << qr_st_str << "]!!" << endl;
+			return false;
+		}
+		v = (v << 6) | (unsigned int)(pos - BASE64_CHARS);
+		n_bits += 6;
+		if (n_bits >= 8) {
+			n_bits -= 8;
+			buf += (char)((v >> n_bits) & 0xFF);
+		}
+	}
+	if ((buf.size() == 0) || (buf.size() % sizeof(QREG_ST_VAL_TYPE) != 0)) {
+		cerr << "qregSt_binary_string_to_value error - wrong state array size in [" << qr_st_str << "]!!" << endl;
+		return false;
+	}
+	qr_st->resize(buf.size() / sizeof(QREG_ST_VAL_TYPE));
+	memcpy(qr_st->data(), buf.data(), buf.size());
+	return true;
+}
+
+// measure index value::binary string conversion helper
+// => index array binary string format: base64 encoded little-endian uint32 array
+
+std::string qSim_qinstruction_base::measure_index_value_to_binary_string(QREG_ST_INDEX_ARRAY_TYPE m_vec) {
+	return binary_to_base64_string(reinterpret_cast<const unsigned char*>(m_vec.data()),
+			                       m_vec.size() * sizeof(QREG_ST_INDEX_TYPE));
+}
+
+// ---------------------------------
+
 // measure index value::string conversion helpers
 // => index array string format: [idx1, ... idxn]
 //
@@ -514,6 +583,21 @@ bool qSim_qinstruction_base::get_msg_param_value_as_state_array(qSim_qasm_messag
 	return res;
 }
 
+bool qSim_qinstruction_base::get_msg_param_value_as_state_array_bin(qSim_qasm_message* msg, std::string par_name,
+		                                                       QREG_ST_VAL_ARRAY_TYPE* par_val) {
+	// read given param binary string as state array and catch exceptions
+	bool res = true;
+	try {
+		std::string str_val = msg->get_param_valueByTag(par_name);
+		res = qSim_qinstruction_base::state_binary_string_to_value(str_val, par_val);
+	} catch (const std::exception& e) {
+		cerr <<"qSim_qinstruction - error reading param: " << par_name << " as <binary state array>!!" << endl;
+		cerr << e.what() << endl;
+		res = false;
+	}
+	return res;
+}
+
 bool qSim_qinstruction_base::get_msg_param_value_as_index_range(qSim_qasm_message* msg, std::string par_name,
 		                                                   QREG_F_INDEX_RANGE_TYPE* par_val) {
 	// read given param string as integer and catch exceptions
@@ -124,6 +124,10 @@ public:
 	static std::string state_value_to_string(QREG_ST_VAL_ARRAY_TYPE q_st);
 	static bool state_string_to_value(std::string qr_st_str, QREG_ST_VAL_ARRAY_TYPE*);
 
+	// state value::binary string (base64 encoded complex128 array) conversion helpers
+	static std::string state_value_to_binary_string(QREG_ST_VAL_ARRAY_TYPE q_st);
+	static bool state_binary_string_to_value(std::string qr_st_str, QREG_ST_VAL_ARRAY_TYPE*);
+
 //	// index range value::string conversion helpers
 //	static std::string index_range_value_to_string(QREG_F_INDEX_RANGE_TYPE q_st);
 //	static bool index_range_string_to_value(std::string qr_st_str, QREG_F_INDEX_RANGE_TYPE*);
@@ -135,6 +139,7 @@ public:
 	// measure index value::string conversion helpers
 	static std::string measure_index_value_to_string(QREG_ST_INDEX_ARRAY_TYPE m_vec);
 	static bool measure_index_string_to_value(std::string qr_st_str, QREG_ST_INDEX_ARRAY_TYPE*);
+	static std::string measure_index_value_to_binary_string(QREG_ST_INDEX_ARRAY_TYPE m_vec);
 
 	// double value to string with precision conversion helpers
 	static std::string double_value_to_string(double d_val);
@@ -147,6 +152,7 @@ public:
 	static bool get_msg_param_value_as_uint(qSim_qasm_message* msg, std::string par_name, unsigned* par_val);
 	static bool get_msg_param_value_as_ftype(qSim_qasm_message* msg, std::string par_name, QASM_F_TYPE* par_val);
 	static bool get_msg_param_value_as_state_array(qSim_qasm_message* msg, std::string par_name, QREG_ST_VAL_ARRAY_TYPE* par_val);
+	static bool get_msg_param_value_as_state_array_bin(qSim_qasm_message* msg, std::string par_name, QREG_ST_VAL_ARRAY_TYPE* par_val);
 	static bool get_msg_param_value_as_index_range(qSim_qasm_message* msg, std::string par_name, QREG_F_INDEX_RANGE_TYPE* par_val);
 	static bool get_msg_param_value_as_bool(qSim_qasm_message* msg, std::string par_name, bool* par_val);
 	static bool get_msg_param_value_as_fargs(qSim_qasm_message* msg, std::string par_name, QREG_F_ARGS_TYPE* par_val);
@@ -190,6 +196,12 @@ protected:
 		return; \
 }
 
+#define SAFE_MSG_GET_PARAM_AS_STATE_ARRAY_BIN(par_name, arr_val) {\
+	m_valid = qSim_qinstruction_base::get_msg_param_value_as_state_array_bin(msg, par_name, &arr_val);\
+	if (!m_valid)\
+		return; \
+}
+
 #define SAFE_MSG_GET_PARAM_AS_INDEX_RANGE(par_name, idx_val) {\
 	m_valid = qSim_qinstruction_base::get_msg_param_value_as_index_range(msg, par_name, &idx_val);\
 	if (!m_valid)\
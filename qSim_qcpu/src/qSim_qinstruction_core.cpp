@@ -34,6 +34,8 @@
  *  1.0   Nov-2022   Module creation.
  *  1.1   Feb-2023   Supported qureg state expectation calculation and fixed
  *                   terminology for state probability measure.
+ *  1.2   Oct-2026   Supported binary (base64) qureg state values and measured
+ *                   state indexes.
  *
  *  --------------------------------------------------------------------------
  */
@@ -77,6 +79,7 @@ qSim_qinstruction_core::qSim_qinstruction_core(qSim_qasm_message* msg) :
 	m_qn = 0;
 	m_qr_h = 0;
 	m_st_array = QREG_ST_VAL_ARRAY_TYPE();
+	m_st_bin = false;
 	m_q_idx = 0;
 	m_q_len = 0;
 	m_rand = false;
@@ -105,6 +108,8 @@ qSim_qinstruction_core::qSim_qinstruction_core(qSim_qasm_message* msg) :
 		case QASM_MSG_ID_QREG_ST_PEEK: {
 			// qureg release or state reset or state read message handling
 			SAFE_MSG_GET_PARAM_AS_INT(QASM_MSG_PARAM_TAG_QREG_H, m_qr_h)
+			// binary state values requested (state read only)
+			m_st_bin = msg->check_param_valueByTag(QASM_MSG_PARAM_TAG_QREG_STVALS_BIN);
 		}
 		break;
 
@@ -119,6 +124,10 @@ qSim_qinstruction_core::qSim_qinstruction_core(qSim_qasm_message* msg) :
 			if (msg->check_param_valueByTag(QASM_MSG_PARAM_TAG_QREG_STVALS)) {
 				SAFE_MSG_GET_PARAM_AS_STATE_ARRAY(QASM_MSG_PARAM_TAG_QREG_STVALS, m_st_array)
 			}
+
+			if (msg->check_param_valueByTag(QASM_MSG_PARAM_TAG_QREG_STVALS_BIN)) {
+				SAFE_MSG_GET_PARAM_AS_STATE_ARRAY_BIN(QASM_MSG_PARAM_TAG_QREG_STVALS_BIN, m_st_array)
+			}
 		}
 		break;
 
@@ -149,6 +158,9 @@ qSim_qinstruction_core::qSim_qinstruction_core(qSim_qasm_message* msg) :
 				// measurement collapse state flag passed as argument (optional)
 				SAFE_MSG_GET_PARAM_AS_BOOL(QASM_MSG_PARAM_TAG_QREG_MCOLL, m_coll)
 			}
+
+			// binary measured state indexes requested
+			m_st_bin = msg->check_param_valueByTag(QASM_MSG_PARAM_TAG_QREG_MSTIDXS_BIN);
 		}
 		break;
 
@@ -301,6 +313,7 @@ qSim_qinstruction_core::qSim_qinstruction_core(QASM_MSG_ID_TYPE type, int qr_h,
 	m_frep = 0;
 	m_flsq = 0;
 	m_futype = QASM_F_TYPE_NULL;
+	m_st_bin = false;
 	m_valid = true;
 }
 
@@ -336,6 +349,7 @@ qSim_qinstruction_core::qSim_qinstruction_core(QASM_MSG_ID_TYPE type, int qr_h,
 	m_frep = 0;
 	m_flsq = 0;
 	m_futype = QASM_F_TYPE_NULL;
+	m_st_bin = false;
 	m_valid = true;
 }
 
@@ -374,6 +388,7 @@ qSim_qinstruction_core::qSim_qinstruction_core(QASM_MSG_ID_TYPE type, int qr_h,
 	m_frep = 0;
 	m_flsq = 0;
 	m_futype = QASM_F_TYPE_NULL;
+	m_st_bin = false;
 	m_valid = true;
 }
 
@@ -412,6 +427,7 @@ qSim_qinstruction_core::qSim_qinstruction_core(QASM_MSG_ID_TYPE type, int qr_h,
 	m_frep = 0;
 	m_flsq = 0;
 	m_futype = QASM_F_TYPE_NULL;
+	m_st_bin = false;
 	m_valid = true;
 }
 
@@ -430,6 +446,7 @@ qSim_qinstruction_core::qSim_qinstruction_core(QASM_MSG_ID_TYPE type, int qr_h,
 	m_rand = false;
 	m_coll = false;
 	m_ex_obsOp = QASM_EX_OBSOP_TYPE_COMP;
+	m_st_bin = false;
 	m_valid = true;
 	m_type = type;
 	switch (m_type) {
@@ -35,6 +35,8 @@
  *  1.1   Feb-2023   Supported qureg state expectation calculation and fixed
  *                   terminology for state probability measure.
  *                   Handled QML function blocks (feature map and q-net).
+ *  1.2   Oct-2026   Supported binary (base64) qureg state values and measured
+ *                   state indexes.
  *
  *  --------------------------------------------------------------------------
  */
@@ -63,6 +65,7 @@ public:
 	int m_qr_h;
 	int m_st_idx;
 	QREG_ST_VAL_ARRAY_TYPE m_st_array;
+	bool m_st_bin; // state values or indexes as binary string (peek and measure only)
 
 	// qureg state measure related
 	int m_q_idx;
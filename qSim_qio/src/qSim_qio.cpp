@@ -31,6 +31,8 @@
  *  1.0   May-2022   Module creation.
  *  1.1   Nov-2022   Updated to align to changes in QASM module.
  *  1.2   Feb-2023   Handled socket polling timeout passage as init argument.
+ *  1.3   Oct-2026   Returned server capabilities on client registration.
+ *                   Echoed request counter in error responses.
  *
  *  --------------------------------------------------------------------------
  */
@@ -143,7 +145,7 @@ void qSim_qio::in_message_cb(qio_raw_msg* msg) {
 				cerr << "qSim_qio::in_message_cb - qasm token not recognised!! -> discarded" << endl;
 
 				// push error message in the out-queue
-				QASM_MSG_COUNTER_TYPE counter = qasm_msg->get_id();
+				QASM_MSG_COUNTER_TYPE counter = qasm_msg->get_counter(); // request counter echoed
 				QASM_MSG_ID_TYPE id = QASM_MSG_ID_RESPONSE;
 				qSim_qasm_message* qasm_err_msg = new qSim_qasm_message(counter, id);
 				qasm_err_msg->add_param_tagValue(QASM_MSG_PARAM_TAG_CLIENT_TOKEN, token);
@@ -160,7 +162,7 @@ void qSim_qio::in_message_cb(qio_raw_msg* msg) {
 		cerr << "qSim_qio::in_message_cb - qasm msg syntax not ok!! -> discarded" << endl;
 
 		// push error message in the out-queue
-		QASM_MSG_COUNTER_TYPE counter = qasm_msg->get_id();
+		QASM_MSG_COUNTER_TYPE counter = qasm_msg->get_counter(); // request counter echoed
 		QASM_MSG_ID_TYPE id = QASM_MSG_ID_RESPONSE;
 		qSim_qasm_message* qasm_err_msg = new qSim_qasm_message(counter, id);
 		qasm_err_msg->add_param_tagValue(QASM_MSG_PARAM_TAG_RESULT, QASM_MSG_PARAM_VAL_NOK);
@@ -224,6 +226,10 @@ void qSim_qio::handle_control_message(qSim_qasm_message* qasm_msg) {
 			qSim_qasm_message* qasm_err_msg = new qSim_qasm_message(counter, id);
 			qasm_err_msg->add_param_tagValue(QASM_MSG_PARAM_TAG_RESULT, QASM_MSG_PARAM_VAL_OK);
 			qasm_err_msg->add_param_tagValue(QASM_MSG_PARAM_TAG_CLIENT_TOKEN, token);
+			if (qasm_msg->check_param_valueByTag(QASM_MSG_PARAM_TAG_CLIENT_CAPS)) {
+				// client asking for capabilities - return the supported ones
+				qasm_err_msg->add_param_tagValue(QASM_MSG_PARAM_TAG_CLIENT_CAPS, QASM_MSG_PARAM_VAL_CAPS_STBIN);
+			}
 			m_msgOut_queue.push(qasm_err_msg);
 		}
 		break;
@@ -31,6 +31,8 @@
  *  1.0   May-2022   Module creation cloning former qreg_qsocket class.
  *  1.1   Feb-2023   Handled socket client polling timeout passage as init argument.
  *                   Code clean-up.
+ *  1.2   Oct-2026   Raw message initialised empty (no release of a garbage buffer
+ *                   when a client disconnects before exchanging any message).
  *
  *  --------------------------------------------------------------------------
  */
@@ -53,7 +55,8 @@ struct qio_raw_msg {
 	unsigned int  m_len;
 	char* 		  m_dataBuf; // dynamic allocation
 
-	~qio_raw_msg() {if (m_len > 0) delete(m_dataBuf); }
+	qio_raw_msg() : m_len(0), m_dataBuf(NULL) {} // empty - nothing to release if no message exchanged
+	~qio_raw_msg() {if (m_len > 0) delete[] m_dataBuf; }
 };
 
 // ----------------